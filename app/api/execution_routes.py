@@ -3,39 +3,64 @@ API routes for quantum execution queries.
 Handles HTTP concerns only - business logic is in the service layer.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi.responses import StreamingResponse
 from neo4j.exceptions import ServiceUnavailable
-from typing import Annotated
+from typing import Annotated, Optional
 
-from app.graph.neo4j_store import Neo4jStore
-from app.services.execution_query_service import ExecutionQueryService
-from app.core.dependencies import get_neo4j_store
+from app.services.execution_query_service import ExecutionQueryService, GRAPH_NODE_FIELDS, decode_cursor
+from app.core.dependencies import get_execution_etag
+from app.core.responses import (
+    JSON_MEDIA_TYPE,
+    ORJSONResponse,
+    body_response,
+    cache_body,
+    encode_body,
+    get_cached_body,
+    iter_and_cache_body,
+    iter_json_object,
+    negotiate_media_type,
+    negotiated_response,
+)
 
-router = APIRouter(prefix="/api/executions", tags=["Executions"])
+router = APIRouter(
+    prefix="/api/executions",
+    tags=["Executions"],
+    default_response_class=ORJSONResponse
+)
 
 # ==================== DEPENDENCY INJECTION ====================
 
-def get_execution_service(
-    store: Annotated[Neo4jStore | None, Depends(get_neo4j_store)]
-) -> ExecutionQueryService:
-    """Dependency injection for execution query service."""
-    return ExecutionQueryService(store)
+def get_execution_service(request: Request) -> ExecutionQueryService:
+    """Dependency injection for execution query service (built once at startup)."""
+    return request.app.state.execution_service
 
 
 # ==================== ROUTES ====================
 
 @router.get("")
 def list_executions(
+    request: Request,
     service: Annotated[ExecutionQueryService, Depends(get_execution_service)],
     page: int = Query(1, ge=1, description="Page number"),
-    limit: int = Query(10, ge=1, le=50, description="Items per page")
+    limit: int = Query(10, ge=1, le=50, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page; continues after it instead of using page")
 ):
     """
     Fetch paginated list of quantum executions.
     Used for dashboard / recent executions view.
     """
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor. Must be a next_cursor from a previous page")
+
     try:
-        return service.list_executions(page=page, limit=limit)
+        return negotiated_response(request, service.list_executions(page=page, limit=limit, cursor=after))
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except ServiceUnavailable:
@@ -43,19 +68,38 @@ def list_executions(
 
 
 @router.get("/{execution_id}")
-def get_execution_overview(
+async def get_execution_overview(
     execution_id: str,
-    service: Annotated[ExecutionQueryService, Depends(get_execution_service)]
+    request: Request,
+    service: Annotated[ExecutionQueryService, Depends(get_execution_service)],
+    etag: Annotated[Optional[str], Depends(get_execution_etag)],
+    include_graph: bool = Query(True, description="Include the event graph; false returns only summary and performance stats")
 ):
     """
     Fetch execution summary, performance stats, and graph data in one response.
     Used for execution header, metrics cards, and graph visualization.
     """
+    media_type = negotiate_media_type(request)
+    cache_key = (execution_id, "overview" if include_graph else "summary", media_type)
+    body = get_cached_body(cache_key)
+    if body is not None:
+        return body_response(body, media_type, etag)
+
     try:
-        result = service.get_execution_overview(execution_id)
-        if not result:
+        if include_graph:
+            # Summary and graph are independent queries, so run them side by side
+            summary, graph = await asyncio.gather(
+                asyncio.to_thread(service.get_execution_summary, execution_id),
+                asyncio.to_thread(service.get_execution_graph, execution_id)
+            )
+        else:
+            summary = await asyncio.to_thread(service.get_execution_summary, execution_id)
+        if not summary:
             raise HTTPException(status_code=404, detail="Execution not found")
-        return result
+        body = encode_body(service.build_overview(summary, graph) if include_graph else summary, media_type)
+        if etag:
+            cache_body(cache_key, body)
+        return body_response(body, media_type, etag)
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except ServiceUnavailable:
@@ -65,14 +109,55 @@ def get_execution_overview(
 @router.get("/{execution_id}/graph")
 def get_execution_graph(
     execution_id: str,
-    service: Annotated[ExecutionQueryService, Depends(get_execution_service)]
+    request: Request,
+    service: Annotated[ExecutionQueryService, Depends(get_execution_service)],
+    etag: Annotated[Optional[str], Depends(get_execution_etag)],
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated node fields to return (id is always included); all fields if omitted"
+    )
 ):
     """
     Fetch event dependency graph for visualization.
     Returns nodes and edges for rendering the execution graph.
+    JSON bodies are streamed as records arrive from Neo4j.
     """
+    node_fields = None
+    if fields is not None:
+        requested = {f.strip() for f in fields.split(",") if f.strip()}
+        invalid = requested - set(GRAPH_NODE_FIELDS)
+        if invalid:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid fields: {sorted(invalid)}. Must be among {list(GRAPH_NODE_FIELDS)}"
+            )
+        requested.add("id")
+        node_fields = tuple(f for f in GRAPH_NODE_FIELDS if f in requested)
+
+    media_type = negotiate_media_type(request)
+    cache_key = (execution_id, "graph", node_fields, media_type)
+    body = get_cached_body(cache_key)
+    if body is not None:
+        return body_response(body, media_type, etag)
+
     try:
-        return service.get_execution_graph(execution_id)
+        graph = service.iter_execution_graph(execution_id, node_fields)
+        if media_type != JSON_MEDIA_TYPE:
+            # Only JSON has an incremental encoder, other formats are built in one piece
+            body = encode_body({key: list(records) for key, records in graph.items()}, media_type)
+            if etag:
+                cache_body(cache_key, body)
+            return body_response(body, media_type, etag)
+
+        chunks = iter_json_object(graph)
+        # Only bodies of executions that exist are worth keeping
+        if etag:
+            chunks = iter_and_cache_body(cache_key, chunks)
+        return StreamingResponse(
+            chunks,
+            media_type=JSON_MEDIA_TYPE,
+            headers={"Vary": "Accept", "ETag": etag} if etag else {"Vary": "Accept"}
+        )
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except ServiceUnavailable:
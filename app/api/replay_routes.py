@@ -1,33 +1,101 @@
-from fastapi import APIRouter, HTTPException, Depends, Path
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Depends, Path, Request
 from neo4j.exceptions import ServiceUnavailable
-from typing import Annotated
+from typing import Annotated, Dict, Optional, Tuple
 
-from app.graph.neo4j_store import Neo4jStore
 from app.replay.replay_engine import ReplayEngine
 from app.replay.divergence import compare_executions
-from app.core.dependencies import get_neo4j_store
+from app.core.dependencies import get_execution_etag
+from app.core.responses import (
+    ORJSONResponse,
+    body_response,
+    cache_body,
+    encode_body,
+    get_cached_body,
+    negotiate_media_type,
+    negotiated_response,
+)
 
-router = APIRouter(prefix="/api/replay", tags=["Replay"])
+router = APIRouter(
+    prefix="/api/replay",
+    tags=["Replay"],
+    default_response_class=ORJSONResponse
+)
 
 # Maximum allowed step index to prevent abuse
 MAX_STEP_INDEX = 10000
 
+# Replay bodies currently being built, keyed by execution ID and media type (event loop only)
+_inflight_replays: Dict[Tuple[str, str], asyncio.Task] = {}
+
 # ==================== DEPENDENCY INJECTION ====================
 
-def get_engine(
-    store: Annotated[Neo4jStore | None, Depends(get_neo4j_store)]
-) -> ReplayEngine:
-    if not store:
+def get_engine(request: Request) -> ReplayEngine:
+    """Dependency injection for the replay engine (built once at startup)."""
+    engine = request.app.state.replay_engine
+    if not engine:
         raise HTTPException(status_code=503, detail="Neo4j not configured")
-    return ReplayEngine(store)
+    return engine
+
+
+def _build_replay_body(engine: ReplayEngine, execution_id: str, media_type: str) -> Optional[bytes]:
+    """
+    Fetch a replay and encode the response body, caching it for later requests.
+    Missing executions are not cached so they become visible once they are recorded.
+    """
+    result = engine.replay_with_metadata(execution_id)
+    if not result:
+        return None
+
+    metadata = result["metadata"] or {}
+    body = encode_body({
+        "execution_id": execution_id,
+        "circuit_name": metadata.get("circuit_name"),
+        "total_steps": len(result["steps"]),
+        "steps": result["steps"],
+        "edges": result["edges"],
+        "is_noisy": metadata.get("is_noisy", False),
+        "noise_config": {
+            "noise_type": metadata.get("noise_type"),
+            "noise_level": metadata.get("noise_level"),
+            "single_gate_error": metadata.get("single_gate_error"),
+            "two_gate_error": metadata.get("two_gate_error"),
+            "measurement_error": metadata.get("measurement_error")
+        } if metadata.get("is_noisy") else None
+    }, media_type)
+    cache_body((execution_id, "replay", media_type), body)
+    return body
+
+
+async def _load_replay_body(engine: ReplayEngine, execution_id: str, media_type: str) -> Optional[bytes]:
+    """
+    Return the encoded replay body from the response cache, or build it.
+    Concurrent cache misses for the same execution share a single build
+    instead of each running their own Neo4j fetch.
+    """
+    key = (execution_id, media_type)
+    body = get_cached_body((execution_id, "replay", media_type))
+    if body is not None:
+        return body
+
+    task = _inflight_replays.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(_build_replay_body, engine, execution_id, media_type))
+        _inflight_replays[key] = task
+        task.add_done_callback(lambda _: _inflight_replays.pop(key, None))
+
+    # Shield so a disconnecting client does not cancel the build for the others
+    return await asyncio.shield(task)
 
 
 # ==================== ROUTES ====================
 
 @router.get("/compare/{exec_id_a}/{exec_id_b}")
-def compare_two_executions(
+async def compare_two_executions(
     exec_id_a: str,
     exec_id_b: str,
+    request: Request,
     engine: Annotated[ReplayEngine, Depends(get_engine)]
 ):
     """
@@ -37,13 +105,12 @@ def compare_two_executions(
     Returns full steps for both executions plus divergence analysis.
     """
     try:
-        # Fetch first execution with metadata
-        result_a = engine.replay_with_metadata(exec_id_a)
+        # Fetch both executions in a single round-trip
+        replays = await asyncio.to_thread(engine.replay_many, [exec_id_a, exec_id_b])
+        result_a = replays.get(exec_id_a)
+        result_b = replays.get(exec_id_b)
         if not result_a or not result_a["steps"]:
             raise HTTPException(status_code=404, detail=f"Execution {exec_id_a} not found")
-        
-        # Fetch second execution with metadata
-        result_b = engine.replay_with_metadata(exec_id_b)
         if not result_b or not result_b["steps"]:
             raise HTTPException(status_code=404, detail=f"Execution {exec_id_b} not found")
         
@@ -54,7 +121,7 @@ def compare_two_executions(
         
         comparison = compare_executions(steps_a, steps_b)
         
-        return {
+        return negotiated_response(request, {
             "execution_a": {
                 "execution_id": exec_id_a,
                 "circuit_name": metadata_a.get("circuit_name"),
@@ -74,7 +141,7 @@ def compare_two_executions(
                 "steps": steps_b
             },
             **comparison
-        }
+        })
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except ServiceUnavailable:
@@ -82,9 +149,11 @@ def compare_two_executions(
 
 
 @router.get("/{execution_id}")
-def replay_execution(
+async def replay_execution(
     execution_id: str,
-    engine: Annotated[ReplayEngine, Depends(get_engine)]
+    request: Request,
+    engine: Annotated[ReplayEngine, Depends(get_engine)],
+    etag: Annotated[Optional[str], Depends(get_execution_etag)]
 ):
     """
     Return full ordered replay sequence for an execution.
@@ -92,27 +161,11 @@ def replay_execution(
     Includes execution metadata with noise configuration if applicable.
     """
     try:
-        result = engine.replay_with_metadata(execution_id)
-        if not result:
+        media_type = negotiate_media_type(request)
+        body = await _load_replay_body(engine, execution_id, media_type)
+        if body is None:
             raise HTTPException(status_code=404, detail="Execution not found")
-
-        metadata = result["metadata"] or {}
-        
-        return {
-            "execution_id": execution_id,
-            "circuit_name": metadata.get("circuit_name"),
-            "total_steps": len(result["steps"]),
-            "steps": result["steps"],
-            "edges": result["edges"],
-            "is_noisy": metadata.get("is_noisy", False),
-            "noise_config": {
-                "noise_type": metadata.get("noise_type"),
-                "noise_level": metadata.get("noise_level"),
-                "single_gate_error": metadata.get("single_gate_error"),
-                "two_gate_error": metadata.get("two_gate_error"),
-                "measurement_error": metadata.get("measurement_error")
-            } if metadata.get("is_noisy") else None
-        }
+        return body_response(body, media_type, etag)
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except ServiceUnavailable:
@@ -123,40 +176,49 @@ def replay_execution(
 def replay_single_step(
     execution_id: str,
     step_index: Annotated[int, Path(ge=0, le=MAX_STEP_INDEX, description="Step index (0-based)")],
-    engine: Annotated[ReplayEngine, Depends(get_engine)]
+    request: Request,
+    engine: Annotated[ReplayEngine, Depends(get_engine)],
+    etag: Annotated[Optional[str], Depends(get_execution_etag)]
 ):
     """
     Get a single step from the execution replay.
     Used for step-by-step navigation (Next/Previous buttons).
     Includes noise info if execution was noisy.
     """
+    media_type = negotiate_media_type(request)
+    cache_key = (execution_id, f"step:{step_index}", media_type)
+    body = get_cached_body(cache_key)
+    if body is not None:
+        return body_response(body, media_type, etag)
+
     try:
-        result = engine.replay_with_metadata(execution_id)
+        result = engine.get_step(execution_id, step_index)
 
         if not result:
             raise HTTPException(status_code=404, detail="Execution not found")
         
-        steps = result["steps"]
-        metadata = result["metadata"] or {}
+        event, total_steps, metadata = result
             
-        if step_index >= len(steps):
+        if step_index >= total_steps:
             raise HTTPException(
                 status_code=400, 
-                detail=f"Invalid step index. Max index is {len(steps) - 1}"
+                detail=f"Invalid step index. Max index is {total_steps - 1}"
             )
 
-        return {
+        body = encode_body({
             "execution_id": execution_id,
             "circuit_name": metadata.get("circuit_name"),
             "step_index": step_index,
-            "total_steps": len(steps),
-            "has_next": step_index < len(steps) - 1,
+            "total_steps": total_steps,
+            "has_next": step_index < total_steps - 1,
             "has_previous": step_index > 0,
-            "event": steps[step_index],
+            "event": event,
             "is_noisy": metadata.get("is_noisy", False),
             "noise_type": metadata.get("noise_type"),
             "noise_level": metadata.get("noise_level")
-        }
+        }, media_type)
+        cache_body(cache_key, body)
+        return body_response(body, media_type, etag)
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except ServiceUnavailable:
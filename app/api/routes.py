@@ -1,13 +1,38 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+import asyncio
+
+import numpy as np
+from fastapi import APIRouter, Query, Request
+from typing import Callable, Literal, Optional
+from qiskit import QuantumCircuit
 from app.quantum.circuits import bell_circuit, ghz_circuit, random_circuit
 from app.services.execution_service import execute_with_observability
+from app.core.responses import ORJSONResponse, streamed_response
+
+router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
+
+# Bell and GHZ circuits are fixed, so build them once and hand out copies
+_BELL = bell_circuit()
+_GHZ = ghz_circuit()
+
+CircuitName = Literal["bell", "ghz", "random"]
+NoiseType = Literal["depolarizing", "thermal"]
+NoiseLevel = Literal["low", "medium", "high", "very_high"]
 
-router = APIRouter(prefix="/api")
+# Circuit factories by name, all called with the gate count; only "random" uses it
+_CIRCUITS: dict[str, Callable[[int], QuantumCircuit]] = {
+    "bell": lambda gate_count: _BELL.copy(),
+    "ghz": lambda gate_count: _GHZ.copy(),
+    "random": lambda gate_count: random_circuit(num_gates=gate_count),
+}
+
+
+def _build_circuit(circuit_name: CircuitName, gate_count: int) -> QuantumCircuit:
+    """Build a fresh circuit for a (validated) circuit name."""
+    return _CIRCUITS[circuit_name](gate_count)
 
 
 @router.post("/execute")
-def execute_default():
+async def execute_default(request: Request):
     """
     Execute the default Bell state quantum circuit.
     
@@ -24,12 +49,13 @@ def execute_default():
             - nodes: Graph nodes representing quantum events
             - edges: Graph edges representing event relationships
     """
-    qc = bell_circuit()
-    return execute_with_observability(qc, "bell")
+    qc = _BELL.copy()
+    result = await asyncio.to_thread(execute_with_observability, qc, "bell")
+    return streamed_response(request, result)
 
 
 @router.post("/execute/{circuit_name}")
-def execute_named(circuit_name: str, gate_count: int = 5):
+async def execute_named(request: Request, circuit_name: CircuitName, gate_count: int = 5):
     """
     Execute a predefined quantum circuit by name.
     
@@ -63,26 +89,18 @@ def execute_named(circuit_name: str, gate_count: int = 5):
         - POST /api/execute/ghz
         - POST /api/execute/random?gate_count=10
     """
-    if circuit_name == "bell":
-        qc = bell_circuit()
-    elif circuit_name == "ghz":
-        qc = ghz_circuit()
-    elif circuit_name == "random":
-        qc = random_circuit(num_gates=gate_count)
-    else:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Circuit '{circuit_name}' not found"
-        )
+    qc = _build_circuit(circuit_name, gate_count)
 
-    return execute_with_observability(qc, circuit_name)
+    result = await asyncio.to_thread(execute_with_observability, qc, circuit_name)
+    return streamed_response(request, result)
 
 
 @router.post("/execute/{circuit_name}/noisy")
-def execute_noisy(
-    circuit_name: str,
-    noise_type: str = Query("depolarizing", description="Noise type: 'depolarizing' or 'thermal'"),
-    noise_level: str = Query("medium", description="Noise level: 'low', 'medium', 'high', 'very_high'"),
+async def execute_noisy(
+    request: Request,
+    circuit_name: CircuitName,
+    noise_type: NoiseType = Query("depolarizing", description="Noise type: 'depolarizing' or 'thermal'"),
+    noise_level: NoiseLevel = Query("medium", description="Noise level: 'low', 'medium', 'high', 'very_high'"),
     gate_count: int = Query(5, description="Number of gates for random circuit")
 ):
     """
@@ -116,47 +134,25 @@ def execute_noisy(
         - POST /api/execute/bell/noisy?noise_type=depolarizing&noise_level=high
         - POST /api/execute/ghz/noisy?noise_type=thermal&noise_level=medium
     """
-    # Validate noise type
-    if noise_type not in ["depolarizing", "thermal"]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid noise_type '{noise_type}'. Choose 'depolarizing' or 'thermal'"
-        )
-    
-    # Validate noise level
-    valid_levels = ["low", "medium", "high", "very_high"]
-    if noise_level not in valid_levels:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid noise_level '{noise_level}'. Choose from {valid_levels}"
-        )
-    
     # Get circuit
-    if circuit_name == "bell":
-        qc = bell_circuit()
-    elif circuit_name == "ghz":
-        qc = ghz_circuit()
-    elif circuit_name == "random":
-        qc = random_circuit(num_gates=gate_count)
-    else:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Circuit '{circuit_name}' not found"
-        )
+    qc = _build_circuit(circuit_name, gate_count)
 
-    return execute_with_observability(
+    result = await asyncio.to_thread(
+        execute_with_observability,
         qc, 
         circuit_name,
         noise_type=noise_type,
         noise_level=noise_level
     )
+    return streamed_response(request, result)
 
 
 @router.post("/execute/compare/{circuit_name}")
-def execute_and_compare(
-    circuit_name: str,
-    noise_type: str = Query("depolarizing", description="Noise type for noisy execution"),
-    noise_level: str = Query("medium", description="Noise level for noisy execution"),
+async def execute_and_compare(
+    request: Request,
+    circuit_name: CircuitName,
+    noise_type: NoiseType = Query("depolarizing", description="Noise type for noisy execution"),
+    noise_level: NoiseLevel = Query("medium", description="Noise level for noisy execution"),
     gate_count: int = Query(5, description="Number of gates for random circuit")
 ):
     """
@@ -174,42 +170,20 @@ def execute_and_compare(
     Returns:
         Both clean and noisy execution results with comparison metrics
     """
-    # Validate inputs
-    if noise_type not in ["depolarizing", "thermal"]:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid noise_type '{noise_type}'. Choose 'depolarizing' or 'thermal'"
-        )
-    
-    valid_levels = ["low", "medium", "high", "very_high"]
-    if noise_level not in valid_levels:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid noise_level '{noise_level}'. Choose from {valid_levels}"
-        )
-    
     # Get circuit
-    if circuit_name == "bell":
-        qc = bell_circuit()
-    elif circuit_name == "ghz":
-        qc = ghz_circuit()
-    elif circuit_name == "random":
-        qc = random_circuit(num_gates=gate_count)
-    else:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Circuit '{circuit_name}' not found"
+    qc = _build_circuit(circuit_name, gate_count)
+    
+    # Execute without noise (ideal) and with noise side by side; each run
+    # gets its own copy of the circuit
+    clean_result, noisy_result = await asyncio.gather(
+        asyncio.to_thread(execute_with_observability, qc.copy(), circuit_name),
+        asyncio.to_thread(
+            execute_with_observability,
+            qc,
+            circuit_name,
+            noise_type=noise_type,
+            noise_level=noise_level
         )
-    
-    # Execute without noise (ideal)
-    clean_result = execute_with_observability(qc, circuit_name)
-    
-    # Execute with noise
-    noisy_result = execute_with_observability(
-        qc,
-        circuit_name,
-        noise_type=noise_type,
-        noise_level=noise_level
     )
     
     # Calculate fidelity approximation based on counts
@@ -217,25 +191,24 @@ def execute_and_compare(
     noisy_counts = noisy_result["counts"]
     
     # Simple fidelity metric: overlap of probability distributions
-    all_outcomes = set(clean_counts.keys()) | set(noisy_counts.keys())
-    total_clean = sum(clean_counts.values())
-    total_noisy = sum(noisy_counts.values())
-    
-    fidelity = 0.0
-    for outcome in all_outcomes:
-        p_clean = clean_counts.get(outcome, 0) / total_clean
-        p_noisy = noisy_counts.get(outcome, 0) / total_noisy
-        fidelity += (p_clean * p_noisy) ** 0.5  # Bhattacharyya coefficient
-    
-    return {
+    # (Bhattacharyya coefficient), over outcome counts aligned in arrays
+    all_outcomes = list(clean_counts.keys() | noisy_counts.keys())
+    clean = np.fromiter((clean_counts.get(o, 0) for o in all_outcomes), dtype=np.float64, count=len(all_outcomes))
+    noisy = np.fromiter((noisy_counts.get(o, 0) for o in all_outcomes), dtype=np.float64, count=len(all_outcomes))
+    
+    fidelity = float(np.sqrt((clean / clean.sum()) * (noisy / noisy.sum())).sum())
+    
+    comparison = {
+        "fidelity": round(fidelity, 4),
+        "noise_type": noise_type,
+        "noise_level": noise_level,
+        "clean_execution_id": clean_result["execution_id"],
+        "noisy_execution_id": noisy_result["execution_id"]
+    }
+
+    return streamed_response(request, {
         "circuit_name": circuit_name,
         "clean_execution": clean_result,
         "noisy_execution": noisy_result,
-        "comparison": {
-            "fidelity": round(fidelity, 4),
-            "noise_type": noise_type,
-            "noise_level": noise_level,
-            "clean_execution_id": clean_result["execution_id"],
-            "noisy_execution_id": noisy_result["execution_id"]
-        }
-    }
+        "comparison": comparison
+    })
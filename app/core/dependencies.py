@@ -3,34 +3,101 @@ Shared dependencies for the application.
 """
 
 import os
+import hashlib
 import logging
+import threading
+from typing import Annotated, Optional
+from cachetools import LRUCache
 from dotenv import load_dotenv
+from fastapi import Depends, HTTPException, Request
+from neo4j.exceptions import ServiceUnavailable
 from app.graph.neo4j_store import Neo4jStore
+from app.core.responses import MSGPACK_MEDIA_TYPE, negotiate_media_type
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Connection settings are read once; the store is built from them on first use
+NEO4J_URL = os.getenv("NEO4J_URL")
+NEO4J_USERNAME = os.getenv("NEO4J_USERNAME", "neo4j")
+NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
+
 _neo4j_store = None
+_neo4j_store_initialized = False
+_neo4j_store_lock = threading.Lock()
+
+# ETags of executions found in Neo4j. Executions are immutable, so once an
+# ETag is known it stays valid and cached responses can skip the lookup.
+_execution_etags: LRUCache = LRUCache(maxsize=1024)
+_execution_etags_lock = threading.Lock()
 
 
 def get_neo4j_store() -> Neo4jStore | None:
-    """Get or create Neo4j store singleton."""
-    global _neo4j_store
-    
-    if _neo4j_store is None:
-        uri = os.getenv("NEO4J_URL")
-        user = os.getenv("NEO4J_USERNAME", "neo4j")
-        password = os.getenv("NEO4J_PASSWORD")
-        
-        if not uri:
+    """
+    Get or create Neo4j store singleton.
+    Creation is locked so concurrent first calls share one driver and
+    connection pool; after that the lock is skipped.
+    """
+    global _neo4j_store, _neo4j_store_initialized
+
+    if _neo4j_store_initialized:
+        return _neo4j_store
+
+    with _neo4j_store_lock:
+        if _neo4j_store_initialized:
+            return _neo4j_store
+
+        if not NEO4J_URL:
             logger.warning("NEO4J_URL environment variable not set")
-            return None
-        if not password:
+        elif not NEO4J_PASSWORD:
             logger.warning("NEO4J_PASSWORD environment variable not set")
-            return None
-            
-        _neo4j_store = Neo4jStore(uri=uri, user=user, password=password)
-        logger.info("Neo4j store initialized successfully")
+        else:
+            _neo4j_store = Neo4jStore(
+                uri=NEO4J_URL, user=NEO4J_USERNAME, password=NEO4J_PASSWORD, database=NEO4J_DATABASE
+            )
+            logger.info("Neo4j store initialized at %s", NEO4J_URL)
+
+        _neo4j_store_initialized = True
+        return _neo4j_store
+
+
+def get_execution_etag(
+    execution_id: str,
+    request: Request,
+    store: Annotated[Neo4jStore | None, Depends(get_neo4j_store)]
+) -> Optional[str]:
+    """
+    ETag for responses derived from a recorded execution.
     
-    return _neo4j_store
+    Executions are immutable once stored, so the ID plus creation time
+    identifies the content. Answers with 304 Not Modified when the client
+    already holds the current version. Returns None when no ETag applies
+    (execution missing or Neo4j unavailable); the route reports those cases.
+    """
+    with _execution_etags_lock:
+        etag = _execution_etags.get(execution_id)
+
+    if etag is None:
+        if store is None:
+            return None
+        try:
+            created_at = store.get_execution_created_at(execution_id)
+        except ServiceUnavailable:
+            return None
+        if created_at is None:
+            return None
+
+        etag = '"' + hashlib.sha1(f"{execution_id}:{created_at}".encode()).hexdigest() + '"'
+        with _execution_etags_lock:
+            _execution_etags[execution_id] = etag
+
+    # Each encoding is a separate representation and needs its own ETag
+    if negotiate_media_type(request) == MSGPACK_MEDIA_TYPE:
+        etag = etag[:-1] + '-msgpack"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+    return etag
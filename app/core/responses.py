@@ -0,0 +1,173 @@
+"""
+Response helpers shared by the API routers.
+"""
+
+import threading
+from typing import Any, Dict, Hashable, Iterator, Optional, Type
+
+import orjson
+import ormsgpack
+from cachetools import LRUCache
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Encoded output is flushed to the client in chunks of roughly this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Encoded bodies of responses for recorded executions. Executions never
+# change once stored, so entries only leave the cache through LRU eviction.
+RESPONSE_CACHE_SIZE = 256
+# Larger bodies are still served, just not cached, to bound memory
+RESPONSE_CACHE_MAX_BODY_BYTES = 1024 * 1024
+
+_response_cache: LRUCache = LRUCache(maxsize=RESPONSE_CACHE_SIZE)
+_response_cache_lock = threading.Lock()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which is much faster than the stdlib encoder on large lists of dicts."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+class MsgPackResponse(Response):
+    """MessagePack response for clients that ask for it; same shape as the JSON body, fewer bytes."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return ormsgpack.packb(content)
+
+
+def negotiate_media_type(request: Request) -> str:
+    """Pick the response encoding from the Accept header. JSON is the default."""
+    accept = request.headers.get("accept", "")
+    if MSGPACK_MEDIA_TYPE in accept or "application/x-msgpack" in accept:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def response_class_for(request: Request) -> Type[Response]:
+    """Response class matching the encoding the client asked for."""
+    if negotiate_media_type(request) == MSGPACK_MEDIA_TYPE:
+        return MsgPackResponse
+    return ORJSONResponse
+
+
+def negotiated_response(request: Request, content: Any) -> Response:
+    """Encode content as JSON or MessagePack depending on the Accept header."""
+    return response_class_for(request)(content, headers={"Vary": "Accept"})
+
+
+def streamed_response(request: Request, fields: Dict[str, Any]) -> Response:
+    """
+    Respond with fields that may hold iterators (see iter_json_object).
+    JSON is streamed in chunks; other encodings get the iterators collected
+    into lists and are sent in one piece.
+    """
+    if negotiate_media_type(request) == JSON_MEDIA_TYPE:
+        return StreamingResponse(iter_json_object(fields), media_type=JSON_MEDIA_TYPE, headers={"Vary": "Accept"})
+    return negotiated_response(request, _collect_iterators(fields))
+
+
+def _collect_iterators(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of fields with iterators turned into lists, in nested dicts too."""
+    return {
+        key: list(value) if isinstance(value, Iterator)
+        else _collect_iterators(value) if isinstance(value, dict)
+        else value
+        for key, value in fields.items()
+    }
+
+
+def encode_body(content: Any, media_type: str) -> bytes:
+    """Encode content for the given media type (see negotiate_media_type)."""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return ormsgpack.packb(content)
+    return orjson.dumps(content)
+
+
+def iter_json_object(fields: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    Encode a dict as a JSON object in chunks.
+
+    Values that are iterators are written as JSON arrays one item at a time,
+    so record streams are never materialized in full. Nested dicts are
+    walked the same way. Other values are encoded in one piece.
+    """
+    buffer = bytearray()
+    yield from _write_json_object(fields, buffer)
+    yield bytes(buffer)
+
+
+def _write_json_object(fields: Dict[str, Any], buffer: bytearray) -> Iterator[bytes]:
+    """Append a JSON object to buffer, yielding and clearing it whenever it fills up."""
+    buffer += b"{"
+    for i, (key, value) in enumerate(fields.items()):
+        if i:
+            buffer += b","
+        buffer += orjson.dumps(key) + b":"
+
+        if isinstance(value, dict):
+            yield from _write_json_object(value, buffer)
+            continue
+        if not isinstance(value, Iterator):
+            buffer += orjson.dumps(value)
+            continue
+
+        buffer += b"["
+        for j, item in enumerate(value):
+            if j:
+                buffer += b","
+            buffer += orjson.dumps(item)
+            if len(buffer) >= STREAM_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]"
+    buffer += b"}"
+
+
+def get_cached_body(key: Hashable) -> Optional[bytes]:
+    """Get a cached response body, keyed by (execution_id, endpoint, ..., media_type)."""
+    with _response_cache_lock:
+        return _response_cache.get(key)
+
+
+def cache_body(key: Hashable, body: bytes) -> None:
+    """Cache an encoded response body unless it is too large."""
+    if len(body) > RESPONSE_CACHE_MAX_BODY_BYTES:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = body
+
+
+def iter_and_cache_body(key: Hashable, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    Pass streamed chunks through and cache the complete body once the stream ends.
+    Collection stops as soon as the body outgrows the cache limit.
+    """
+    parts = []
+    size = 0
+    for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size > RESPONSE_CACHE_MAX_BODY_BYTES:
+                parts = None
+            else:
+                parts.append(chunk)
+        yield chunk
+
+    if parts is not None:
+        cache_body(key, b"".join(parts))
+
+
+def body_response(body: bytes, media_type: str, etag: Optional[str] = None) -> Response:
+    """Wrap an already encoded body in a response, with its ETag if known."""
+    headers = {"Vary": "Accept"}
+    if etag:
+        headers["ETag"] = etag
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -1,72 +1,128 @@
-import networkx as nx
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
 
-def build_event_graph(events):
+
+@dataclass(slots=True)
+class EventGraphArrays:
     """
-    Build event graph with temporal (NEXT) and data-flow (QUBIT_DEP) edges.
+    Event graph as parallel lists (structure of arrays).
     
-    - NEXT: Sequential temporal order of events
-    - QUBIT_DEP: Data dependency based on shared qubits between events
+    Index i of every node_* list describes the same event; index j of the
+    next_* / qdep_* lists describes the same edge. Attributes an event does
+    not have are None.
     """
-    G = nx.DiGraph()
+    node_ids: List[int] = field(default_factory=list)
+    node_types: List[str] = field(default_factory=list)
+    node_timestamps: List[int] = field(default_factory=list)
+    node_qubits: List[Optional[List[int]]] = field(default_factory=list)
+    node_gate_names: List[Optional[str]] = field(default_factory=list)
+    node_classical_bits: List[Optional[List[int]]] = field(default_factory=list)
+    next_src: List[int] = field(default_factory=list)
+    next_dst: List[int] = field(default_factory=list)
+    qdep_src: List[int] = field(default_factory=list)
+    qdep_dst: List[int] = field(default_factory=list)
+    qdep_qubits: List[List[int]] = field(default_factory=list)
 
-    # Add nodes with full event data
-    for event in events:
-        node_data = {
-            "type": event.event_type,
-            "timestamp": event.timestamp
-        }
-        # Add qubits if available (GateEvent, MeasurementEvent)
-        if hasattr(event, "qubits"):
-            node_data["qubits"] = event.qubits
-        # Add gate_name if available (GateEvent)
-        if hasattr(event, "gate_name"):
-            node_data["gate_name"] = event.gate_name
-        # Add classical bits if available (MeasurementEvent)
-        if hasattr(event, "classical_bits"):
-            node_data["classical_bits"] = event.classical_bits
-            
-        G.add_node(event.event_id, **node_data)
-
-    # Add NEXT edges (temporal order)
-    for i in range(len(events) - 1):
-        G.add_edge(
-            events[i].event_id,
-            events[i + 1].event_id,
-            relation="NEXT"
+    def nodes(self) -> List[Tuple[int, Dict]]:
+        """Nodes as [(event_id, attrs), ...], the shape of G.nodes(data=True)."""
+        return list(self.iter_nodes())
+
+    def iter_nodes(self) -> Iterator[Tuple[int, Dict]]:
+        """Lazy version of nodes(), building each attrs dict as it is consumed."""
+        for event_id, event_type, timestamp, qubits, gate_name, classical_bits in zip(
+            self.node_ids, self.node_types, self.node_timestamps,
+            self.node_qubits, self.node_gate_names, self.node_classical_bits
+        ):
+            node_data = {"type": event_type, "timestamp": timestamp}
+            if qubits is not None:
+                node_data["qubits"] = qubits
+            if gate_name is not None:
+                node_data["gate_name"] = gate_name
+            if classical_bits is not None:
+                node_data["classical_bits"] = classical_bits
+            yield event_id, node_data
+
+    def edges(self) -> List[Tuple[int, int, Dict]]:
+        """Edges as [(src, dst, attrs), ...], NEXT edges first, then QUBIT_DEP."""
+        return list(self.iter_edges())
+
+    def iter_edges(self) -> Iterator[Tuple[int, int, Dict]]:
+        """Lazy version of edges()."""
+        # NEXT attrs are identical and never modified, so one dict is shared
+        next_data = {"relation": "NEXT"}
+        yield from ((src, dst, next_data) for src, dst in zip(self.next_src, self.next_dst))
+        yield from (
+            (src, dst, {"relation": "QUBIT_DEP", "qubits": qubits})
+            for src, dst, qubits in zip(self.qdep_src, self.qdep_dst, self.qdep_qubits)
         )
 
-    # Add QUBIT_DEP edges (data-flow based on shared qubits)
-    # Track last event that touched each qubit
-    qubit_last_event = {}  # qubit_index -> event_id
+    def to_networkx(self):
+        """
+        Build a NetworkX DiGraph with the same nodes and edges, for analysis
+        that needs graph algorithms. Not used on the request path.
+        """
+        import networkx as nx
+
+        G = nx.DiGraph()
+        G.add_nodes_from(self.nodes())
+        G.add_edges_from(
+            (src, dst, dict(data)) for src, dst, data in self.edges()
+        )
+        return G
+
+
+def build_event_graph(events, num_qubits: Optional[int] = None) -> EventGraphArrays:
+    """
+    Build event graph with temporal (NEXT) and data-flow (QUBIT_DEP) edges.
     
+    - NEXT: Sequential temporal order of events
+    - QUBIT_DEP: Data dependency based on shared qubits between events.
+      Dependencies between consecutive events are covered by NEXT and
+      skipped; qubits shared with the same earlier event aggregate onto one edge.
+
+    num_qubits sizes the per-qubit state; callers that know the circuit
+    width should pass it, otherwise it is derived from the events.
+    """
+    graph = EventGraphArrays()
+
+    if num_qubits is None:
+        events = list(events)
+        num_qubits = 1 + max((q for event in events if event.qubits for q in event.qubits), default=-1)
+
+    qubit_last_event = [-1] * num_qubits   # qubit_index -> event_id, -1 if untouched
+    pending_qdep = defaultdict(list)  # (src_event_id, dst_event_id) -> qubits
+    previous_event_id = None
+
     for event in events:
-        if hasattr(event, "qubits") and event.qubits:
-            # Find dependencies: events that last touched any of our qubits
-            dependencies = set()
-            for qubit in event.qubits:
-                if qubit in qubit_last_event:
-                    dependencies.add((qubit_last_event[qubit], qubit))
-            
-            # Create QUBIT_DEP edges
-            for (dep_event_id, qubit) in dependencies:
-                # Avoid duplicate edges, aggregate qubits if edge exists
-                if G.has_edge(dep_event_id, event.event_id):
-                    existing = G.edges[dep_event_id, event.event_id]
-                    if existing.get("relation") == "QUBIT_DEP":
-                        existing["qubits"].append(qubit)
-                        continue
-                
-                # Only add if it's not already a NEXT edge
-                if not G.has_edge(dep_event_id, event.event_id):
-                    G.add_edge(
-                        dep_event_id,
-                        event.event_id,
-                        relation="QUBIT_DEP",
-                        qubits=[qubit]
-                    )
-            
-            # Update last event for each qubit
-            for qubit in event.qubits:
-                qubit_last_event[qubit] = event.event_id
-
-    return G
+        event_id = event.event_id
+        qubits = event.qubits
+
+        graph.node_ids.append(event_id)
+        graph.node_types.append(event.event_type)
+        graph.node_timestamps.append(event.timestamp)
+        graph.node_qubits.append(qubits)
+        graph.node_gate_names.append(event.gate_name)
+        graph.node_classical_bits.append(event.classical_bits)
+
+        if qubits:
+            for qubit in qubits:
+                dep_event_id = qubit_last_event[qubit]
+                if dep_event_id != -1 and dep_event_id != previous_event_id:
+                    pending_qdep[(dep_event_id, event_id)].append(qubit)
+
+            for qubit in qubits:
+                qubit_last_event[qubit] = event_id
+
+        previous_event_id = event_id
+
+    # NEXT links each event to its successor, so both columns are slices of the node IDs
+    graph.next_src = graph.node_ids[:-1]
+    graph.next_dst = graph.node_ids[1:]
+
+    if pending_qdep:
+        src_dst, qubits = zip(*pending_qdep.items())
+        graph.qdep_src, graph.qdep_dst = map(list, zip(*src_dst))
+        graph.qdep_qubits = list(qubits)
+
+    return graph
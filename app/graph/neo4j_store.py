@@ -1,221 +1,594 @@
-from neo4j import GraphDatabase
-from neo4j.exceptions import ServiceUnavailable, AuthError
-from typing import Optional, List, Dict, Any
+from neo4j import GraphDatabase, RoutingControl, READ_ACCESS, Session
+from neo4j.exceptions import ServiceUnavailable, AuthError, Neo4jError, TransientError
+from typing import Optional, List, Dict, Any, Iterator, Callable, Hashable, Tuple
+from cachetools import LRUCache, TTLCache
 import logging
+import threading
+import time
+
+from app.graph.graph_builder import EventGraphArrays
 
 logger = logging.getLogger(__name__)
 
+# Indexes and constraints the queries below rely on. IF NOT EXISTS makes
+# them safe to run on every start.
+SCHEMA_STATEMENTS = [
+    # Backs the (execution_id, event_id) lookups and guards against duplicate events
+    """
+    CREATE CONSTRAINT event_uid IF NOT EXISTS
+    FOR (e:Event) REQUIRE (e.execution_id, e.event_id) IS UNIQUE
+    """,
+    # Backs the execution_id lookups and guards against duplicate executions
+    """
+    CREATE CONSTRAINT execution_id_unique IF NOT EXISTS
+    FOR (x:Execution) REQUIRE x.execution_id IS UNIQUE
+    """,
+    # Backs the ORDER BY created_at DESC of the executions list
+    """
+    CREATE INDEX execution_created_at_idx IF NOT EXISTS
+    FOR (x:Execution) ON (x.created_at)
+    """,
+]
+
+
+# Connection pool sizing for the API's concurrency (worker threads plus
+# the execute routes' to_thread calls)
+MAX_CONNECTION_POOL_SIZE = 50
+# A request waiting this long for a free connection is better failed than queued
+CONNECTION_ACQUISITION_TIMEOUT_SECONDS = 10.0
+# Recycle pooled connections before load balancers or firewalls drop them silently
+MAX_CONNECTION_LIFETIME_SECONDS = 3600
+# Fail fast when Neo4j is unreachable instead of holding requests open
+CONNECTION_TIMEOUT_SECONDS = 5.0
+MAX_TRANSACTION_RETRY_SECONDS = 10.0
+# After a connection failure, Neo4j work is skipped for this long before trying again
+RECONNECT_INTERVAL_SECONDS = 30.0
+
+# Read results per execution. Executions are immutable once stored, so these
+# only leave through LRU eviction; executions that were not found are not cached.
+EXECUTION_CACHE_SIZE = 1024
+# The executions list changes with every new execution, so it is only kept briefly
+LIST_CACHE_SIZE = 128
+LIST_CACHE_TTL_SECONDS = 5.0
+
+# Executions with more events or edges than this are written in several
+# statements of at most this many rows each (still in one transaction), so no
+# single statement's parameters or intermediate lists grow with circuit size
+WRITE_CHUNK_SIZE = 5000
+
+# Subqueries collecting an execution's nodes (ordered by timestamp), NEXT
+# edges and QUBIT_DEP edges; same records as iter_execution_nodes / iter_execution_edges
+GRAPH_SUBQUERIES = """
+    CALL {
+        MATCH (e:Event {execution_id: $execution_id})
+        WITH e ORDER BY e.timestamp
+        RETURN collect({
+            id: e.event_id,
+            type: e.event_type,
+            gate: e.gate_name,
+            qubits: e.qubits,
+            timestamp: e.timestamp
+        }) AS nodes
+    }
+    CALL {
+        MATCH (a:Event {execution_id: $execution_id})-[:NEXT]->(b:Event)
+        RETURN collect({
+            source: a.event_id,
+            target: b.event_id,
+            relation: 'NEXT'
+        }) AS next_edges
+    }
+    CALL {
+        MATCH (a:Event {execution_id: $execution_id})-[r:QUBIT_DEP]->(b:Event)
+        RETURN collect({
+            source: a.event_id,
+            target: b.event_id,
+            relation: 'QUBIT_DEP',
+            qubits: r.qubits
+        }) AS qubit_dep_edges
+    }
+"""
+
+# Final clause of an execution write: sets the persistence time, measured on
+# the server from started (datetime.realtime() at the start of the write),
+# and the total time on Execution x, and returns both
+SET_PERSISTENCE_TIMES = """
+    WITH x, duration.between(started, datetime.realtime()) AS elapsed
+    WITH x, elapsed.seconds * 1000 + elapsed.nanosecondsOfSecond / 1000000.0 AS persistence_ms
+    SET x.neo4j_persistence_time_ms = round(persistence_ms, 4),
+        x.total_observability_time_ms = round(
+            coalesce(x.event_extraction_time_ms, 0) + coalesce(x.in_memory_graph_time_ms, 0) + persistence_ms, 4
+        )
+    RETURN x.neo4j_persistence_time_ms AS neo4j_persistence_time_ms,
+           x.total_observability_time_ms AS total_observability_time_ms
+"""
+
 
 class Neo4jStore:
-    def __init__(self, uri: str, user: str, password: str):
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+    def __init__(self, uri: str, user: str, password: str, database: Optional[str] = None):
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+            connection_acquisition_timeout=CONNECTION_ACQUISITION_TIMEOUT_SECONDS,
+            max_connection_lifetime=MAX_CONNECTION_LIFETIME_SECONDS,
+            keep_alive=True,
+            connection_timeout=CONNECTION_TIMEOUT_SECONDS,
+            max_transaction_retry_time=MAX_TRANSACTION_RETRY_SECONDS
+        )
+        # Naming the database explicitly saves the driver a home-database lookup
+        self.database = database
+        # The driver connects lazily; call warm_up (at startup) to connect early
         self._connected: Optional[bool] = None
+        self._retry_at = 0.0
+        self._schema_initialized = False
+        self._execution_cache: LRUCache = LRUCache(maxsize=EXECUTION_CACHE_SIZE)
+        self._list_cache: TTLCache = TTLCache(maxsize=LIST_CACHE_SIZE, ttl=LIST_CACHE_TTL_SECONDS)
+        self._cache_lock = threading.Lock()
 
     def close(self):
         self.driver.close()
 
+    def session(self, **config) -> Session:
+        """
+        Open a session on the configured database. Close it (or use it as a context manager) when done.
+        Sessions share the bookmarks of driver.execute_query, so reads made there see writes made here.
+        """
+        config.setdefault("bookmark_manager", self.driver.execute_query_bookmark_manager)
+        return self.driver.session(database=self.database, **config)
+
     def is_available(self) -> bool:
-        """Check if Neo4j connection is available."""
-        if self._connected is not None:
-            return self._connected
+        """
+        Check if Neo4j connection is available.
+        A successful check is remembered; a failed one is rechecked after RECONNECT_INTERVAL_SECONDS.
+        """
+        if self._connected or self._in_backoff():
+            return bool(self._connected)
         try:
             self.driver.verify_connectivity()
             self._connected = True
             return True
         except (ServiceUnavailable, AuthError) as e:
             logger.warning(f"Neo4j connection unavailable: {e}")
-            self._connected = False
+            self._mark_unavailable()
             return False
 
+    def warm_up(self) -> None:
+        """Verify connectivity and set up the schema. Meant to run once, off the request path."""
+        if self.is_available():
+            self._ensure_schema()
+
+    def _mark_unavailable(self) -> None:
+        self._connected = False
+        self._retry_at = time.monotonic() + RECONNECT_INTERVAL_SECONDS
+
+    def _in_backoff(self) -> bool:
+        """True while a recent connection failure says Neo4j work should be skipped."""
+        return self._connected is False and time.monotonic() < self._retry_at
+
+    def _check_backoff(self) -> None:
+        """Fail fast with ServiceUnavailable instead of waiting on a connection known to be down."""
+        if self._in_backoff():
+            raise ServiceUnavailable("Neo4j unavailable, retrying later")
+
+    def _ensure_schema(self) -> None:
+        """
+        Create indexes and constraints once per store.
+        Connection and transient failures are retried before the next write.
+        Other errors (missing schema privileges, data that violates a
+        constraint) would fail the same way again, so they are logged and
+        the remaining statements still run.
+        """
+        if self._schema_initialized or self._in_backoff():
+            return
+        try:
+            # Auto-commit runs fail fast; managed transactions would keep
+            # retrying while Neo4j is down
+            with self.session() as session:
+                for statement in SCHEMA_STATEMENTS:
+                    try:
+                        session.run(statement).consume()
+                    except (TransientError, ServiceUnavailable, AuthError):
+                        raise
+                    except Neo4jError as e:
+                        logger.warning(f"Neo4j schema statement failed, not retrying: {e}")
+            self._schema_initialized = True
+        except (ServiceUnavailable, AuthError) as e:
+            logger.warning(f"Neo4j unavailable, schema setup deferred: {e}")
+            self._mark_unavailable()
+        except TransientError as e:
+            logger.warning(f"Neo4j schema setup failed, retrying before the next write: {e}")
+
     def _execute_query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict]:
-        """Execute a read query and return results as list of dicts."""
+        """
+        Execute a read query and return results as list of dicts.
+        Uses the driver-managed execute_query (pooled connection, retries, read routing).
+        """
+        self._check_backoff()
         try:
-            with self.driver.session() as session:
-                result = session.run(query, parameters or {})
-                return [dict(record) for record in result]
+            records, _, keys = self.driver.execute_query(
+                query,
+                parameters_=parameters or {},
+                routing_=RoutingControl.READ,
+                database_=self.database
+            )
+            # All records share the result's keys; zipping them is about twice
+            # as fast as dict(record) and much faster than record.data()
+            return [dict(zip(keys, record)) for record in records]
         except ServiceUnavailable as e:
             logger.error(f"Neo4j service unavailable: {e}")
-            self._connected = False
+            self._mark_unavailable()
             raise
 
+    def _iter_query(self, query: str, parameters: Dict[str, Any] = None) -> Iterator[Dict]:
+        """
+        Execute a read query and return an iterator that lazily yields records as dicts.
+        The query is sent before this returns, so an unreachable database raises
+        ServiceUnavailable here rather than once the caller starts iterating.
+        The session stays open until the iterator is exhausted or closed.
+        """
+        self._check_backoff()
+        session = self.session(default_access_mode=READ_ACCESS)
+        try:
+            result = session.run(query, parameters or {})
+            keys = result.keys()
+        except ServiceUnavailable as e:
+            session.close()
+            logger.error(f"Neo4j service unavailable: {e}")
+            self._mark_unavailable()
+            raise
+        except BaseException:
+            session.close()
+            raise
+        records = self._iter_records(session, result, keys)
+        # Step past the priming yield, so closing the iterator before it is
+        # read still closes the session
+        next(records)
+        return records
+
+    def _iter_records(self, session: Session, result, keys: List[str]) -> Iterator[Dict]:
+        """Yield the records of an _iter_query result, closing its session at the end."""
+        try:
+            with session:
+                yield None
+                for record in result:
+                    yield dict(zip(keys, record))
+        except ServiceUnavailable as e:
+            logger.error(f"Neo4j service unavailable: {e}")
+            self._mark_unavailable()
+            raise
+
+    def _cached(self, cache: LRUCache, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Return a cached read result, or load it and cache it if it is not empty.
+        The query runs outside the lock; concurrent misses may both load.
+        """
+        with self._cache_lock:
+            result = cache.get(key)
+        if result is not None:
+            return result
+
+        result = load()
+        if result:
+            with self._cache_lock:
+                cache[key] = result
+        return result
+
+    def _invalidate_cache(self, execution_id: str) -> None:
+        """Drop cached reads that a newly stored execution makes stale."""
+        with self._cache_lock:
+            self._execution_cache.pop(("execution", execution_id), None)
+            self._execution_cache.pop(("graph", execution_id), None)
+            self._list_cache.clear()
+
     def _execute_write(self, query: str, parameters: Dict[str, Any] = None) -> None:
-        """Execute a write query."""
+        """Execute a write query in a driver-managed transaction (pooled connection, retries, write routing)."""
+        self._check_backoff()
         try:
-            with self.driver.session() as session:
-                session.run(query, parameters or {})
+            self.driver.execute_query(
+                query,
+                parameters_=parameters or {},
+                routing_=RoutingControl.WRITE,
+                database_=self.database
+            )
             self._connected = True
         except ServiceUnavailable as e:
             logger.error(f"Neo4j service unavailable: {e}")
-            self._connected = False
+            self._mark_unavailable()
             raise
 
     # ==================== WRITE OPERATIONS ====================
 
     def store_event_graph(
         self, 
-        events, 
         execution_id: str, 
-        edges, 
+        graph: EventGraphArrays, 
         circuit_name: str, 
         performance: dict,
         noise_config: Optional[Dict] = None
-    ) -> bool:
-        """Store quantum execution event graph in Neo4j, including Execution node and performance stats."""
-        try:
-            with self.driver.session() as session:
-                # 1. Create Execution node with performance stats and noise config
-                session.run(
-                    """
-                    CREATE (x:Execution {
-                        execution_id: $execution_id,
-                        circuit_name: $circuit_name,
-                        event_extraction_time_ms: $event_extraction_time_ms,
-                        in_memory_graph_time_ms: $in_memory_graph_time_ms,
-                        neo4j_persistence_time_ms: $neo4j_persistence_time_ms,
-                        total_observability_time_ms: $total_observability_time_ms,
-                        is_noisy: $is_noisy,
-                        noise_type: $noise_type,
-                        noise_level: $noise_level,
-                        single_gate_error: $single_gate_error,
-                        two_gate_error: $two_gate_error,
-                        measurement_error: $measurement_error,
-                        created_at: datetime()
-                    })
-                    """,
-                    execution_id=execution_id,
-                    circuit_name=circuit_name,
-                    event_extraction_time_ms=performance.get("event_extraction_time_ms"),
-                    in_memory_graph_time_ms=performance.get("in_memory_graph_time_ms"),
-                    neo4j_persistence_time_ms=performance.get("neo4j_persistence_time_ms"),
-                    total_observability_time_ms=performance.get("total_observability_time_ms"),
-                    is_noisy=noise_config is not None,
-                    noise_type=noise_config.get("noise_type") if noise_config else None,
-                    noise_level=noise_config.get("noise_level") if noise_config else None,
-                    single_gate_error=noise_config.get("single_gate_error") if noise_config else None,
-                    two_gate_error=noise_config.get("two_gate_error") if noise_config else None,
-                    measurement_error=noise_config.get("measurement_error") if noise_config else None
-                )
+    ) -> Optional[Dict[str, float]]:
+        """
+        Store quantum execution event graph in Neo4j, including Execution node and performance stats.
+        All writes run in one transaction, so an execution is stored completely or not at all.
+        neo4j_persistence_time_ms and total_observability_time_ms are measured on the
+        server during the write and set by it, so performance only needs the extraction
+        and graph build times.
 
-                # 2. Create Event nodes and link to Execution (now includes qubits)
-                event_data = [
-                    {
-                        "execution_id": execution_id,
-                        "event_id": event.event_id,
-                        "event_type": event.event_type,
-                        "timestamp": event.timestamp,
-                        "gate_name": getattr(event, "gate_name", None),
-                        "qubits": getattr(event, "qubits", None),
-                        "classical_bits": getattr(event, "classical_bits", None),
-                        "circuit_name": circuit_name
-                    }
-                    for event in events
-                ]
-
-                session.run(
-                    """
-                    UNWIND $events AS event
-                    MATCH (x:Execution {execution_id: event.execution_id})
-                    CREATE (e:Event {
-                        execution_id: event.execution_id,
-                        event_id: event.event_id,
-                        event_type: event.event_type,
-                        timestamp: event.timestamp,
-                        gate_name: event.gate_name,
-                        qubits: event.qubits,
-                        classical_bits: event.classical_bits,
-                        circuit_name: event.circuit_name
-                    })
-                    CREATE (x)-[:HAS_EVENT]->(e)
-                    """,
-                    events=event_data
-                )
+        Returns:
+            The stored persistence and total times, or None if the graph was not stored
+        """
+        execution = {
+            "execution_id": execution_id,
+            "circuit_name": circuit_name,
+            "event_extraction_time_ms": performance.get("event_extraction_time_ms"),
+            "in_memory_graph_time_ms": performance.get("in_memory_graph_time_ms"),
+            "is_noisy": noise_config is not None,
+            "noise_type": noise_config.get("noise_type") if noise_config else None,
+            "noise_level": noise_config.get("noise_level") if noise_config else None,
+            "single_gate_error": noise_config.get("single_gate_error") if noise_config else None,
+            "two_gate_error": noise_config.get("two_gate_error") if noise_config else None,
+            "measurement_error": noise_config.get("measurement_error") if noise_config else None
+        }
 
-                # 3. Create NEXT edges in batch
-                next_edges = [
-                    {
-                        "execution_id": execution_id,
-                        "src": src,
-                        "dst": dst
-                    }
-                    for src, dst, data in edges
-                    if data.get("relation") == "NEXT"
-                ]
-
-                session.run(
-                    """
-                    UNWIND $edges AS edge
-                    MATCH (a:Event {execution_id: edge.execution_id, event_id: edge.src}),
-                          (b:Event {execution_id: edge.execution_id, event_id: edge.dst})
-                    CREATE (a)-[:NEXT]->(b)
-                    """,
-                    edges=next_edges
-                )
+        # One positional row per event (unpacked by index in _write_event_graph);
+        # tuples are smaller to build and pack than per-event dicts, and the
+        # execution-wide values are sent once as parameters
+        event_data = list(zip(
+            graph.node_ids, graph.node_types, graph.node_timestamps,
+            graph.node_gate_names, graph.node_qubits, graph.node_classical_bits
+        ))
 
-                # 4. Create QUBIT_DEP edges in batch (new!)
-                qubit_dep_edges = [
-                    {
-                        "execution_id": execution_id,
-                        "src": src,
-                        "dst": dst,
-                        "qubits": data.get("qubits", [])
-                    }
-                    for src, dst, data in edges
-                    if data.get("relation") == "QUBIT_DEP"
-                ]
-
-                if qubit_dep_edges:
-                    session.run(
-                        """
-                        UNWIND $edges AS edge
-                        MATCH (a:Event {execution_id: edge.execution_id, event_id: edge.src}),
-                              (b:Event {execution_id: edge.execution_id, event_id: edge.dst})
-                        CREATE (a)-[:QUBIT_DEP {qubits: edge.qubits}]->(b)
-                        """,
-                        edges=qubit_dep_edges
-                    )
+        # Edges refer to events by position in event_data, so the write can
+        # resolve them from the nodes it just created instead of matching.
+        # They are sent as parallel lists of positions rather than one dict per edge.
+        position = {event_id: i for i, event_id in enumerate(graph.node_ids)}.__getitem__
+        edges = {
+            "next_src": list(map(position, graph.next_src)),
+            "next_dst": list(map(position, graph.next_dst)),
+            "qdep_src": list(map(position, graph.qdep_src)),
+            "qdep_dst": list(map(position, graph.qdep_dst)),
+            "qdep_qubits": graph.qdep_qubits,
+        }
+
+        self._ensure_schema()
+        if self._in_backoff():
+            logger.warning("Neo4j unavailable, skipping graph storage")
+            return None
 
+        try:
+            with self.session() as session:
+                timings = session.execute_write(
+                    self._write_event_graph, execution, event_data, edges
+                )
             self._connected = True
-            return True
+            self._invalidate_cache(execution_id)
+            return timings
 
         except ServiceUnavailable as e:
             logger.warning(f"Neo4j service unavailable, skipping graph storage: {e}")
-            self._connected = False
-            return False
+            self._mark_unavailable()
+            return None
+
+    @staticmethod
+    def _write_event_graph(
+        tx,
+        execution: Dict[str, Any],
+        event_data: List[tuple],
+        edges: Dict[str, List]
+    ) -> Dict[str, float]:
+        """
+        Transaction function for store_event_graph; may be retried by the driver.
+        Returns the persistence and total times it set on the Execution node.
+        """
+        if max(len(event_data), len(edges["next_src"]), len(edges["qdep_src"])) > WRITE_CHUNK_SIZE:
+            return Neo4jStore._write_event_graph_chunked(tx, execution, event_data, edges)
+
+        # Execution node (performance stats and noise config come in as one
+        # property map), its Event nodes, then NEXT and QUBIT_DEP edges between
+        # the collected nodes by position, all in a single statement. The write
+        # is timed on the server and the persistence and total times are set
+        # last, so no follow-up update is needed.
+        result = tx.run(
+            """
+            WITH datetime.realtime() AS started
+            CREATE (x:Execution $execution)
+            SET x.created_at = datetime()
+            WITH x, started
+            CALL {
+                WITH x
+                UNWIND $events AS event
+                CREATE (e:Event {
+                    execution_id: $execution.execution_id,
+                    event_id: event[0],
+                    event_type: event[1],
+                    timestamp: event[2],
+                    gate_name: event[3],
+                    qubits: event[4],
+                    classical_bits: event[5],
+                    circuit_name: $execution.circuit_name
+                })
+                CREATE (x)-[:HAS_EVENT]->(e)
+                RETURN collect(e) AS nodes
+            }
+            CALL {
+                WITH nodes
+                UNWIND range(0, size($next_src) - 1) AS i
+                WITH nodes[$next_src[i]] AS a, nodes[$next_dst[i]] AS b
+                CREATE (a)-[:NEXT]->(b)
+            }
+            CALL {
+                WITH nodes
+                UNWIND range(0, size($qdep_src) - 1) AS i
+                WITH nodes[$qdep_src[i]] AS a, nodes[$qdep_dst[i]] AS b, $qdep_qubits[i] AS qubits
+                CREATE (a)-[:QUBIT_DEP {qubits: qubits}]->(b)
+            }
+            """ + SET_PERSISTENCE_TIMES,
+            execution=execution,
+            events=event_data,
+            **edges
+        )
+        return result.single().data()
+
+    @staticmethod
+    def _write_event_graph_chunked(
+        tx,
+        execution: Dict[str, Any],
+        event_data: List[tuple],
+        edges: Dict[str, List]
+    ) -> Dict[str, float]:
+        """
+        Chunked variant of _write_event_graph for large executions.
+        Edges span chunks, so their endpoints are matched by event ID
+        (backed by the event_uid constraint) instead of by position.
+        The server's start time is passed on to the last chunk, which sets
+        the persistence and total times.
+        """
+        started = tx.run(
+            """
+            WITH datetime.realtime() AS started
+            CREATE (x:Execution $execution)
+            SET x.created_at = datetime()
+            RETURN started
+            """,
+            execution=execution
+        ).single()["started"]
+
+        execution_id = execution["execution_id"]
+        event_ids = [event[0] for event in event_data]
+        statements = []
+        for start in range(0, len(event_data), WRITE_CHUNK_SIZE):
+            statements.append((
+                """
+                MATCH (x:Execution {execution_id: $execution_id})
+                UNWIND $events AS event
+                CREATE (e:Event {
+                    execution_id: $execution_id,
+                    event_id: event[0],
+                    event_type: event[1],
+                    timestamp: event[2],
+                    gate_name: event[3],
+                    qubits: event[4],
+                    classical_bits: event[5],
+                    circuit_name: $circuit_name
+                })
+                CREATE (x)-[:HAS_EVENT]->(e)
+                """,
+                {
+                    "circuit_name": execution["circuit_name"],
+                    "events": event_data[start:start + WRITE_CHUNK_SIZE]
+                }
+            ))
+
+        for start in range(0, len(edges["next_src"]), WRITE_CHUNK_SIZE):
+            end = start + WRITE_CHUNK_SIZE
+            statements.append((
+                """
+                UNWIND range(0, size($src) - 1) AS i
+                MATCH (a:Event {execution_id: $execution_id, event_id: $src[i]})
+                MATCH (b:Event {execution_id: $execution_id, event_id: $dst[i]})
+                CREATE (a)-[:NEXT]->(b)
+                """,
+                {
+                    "src": [event_ids[p] for p in edges["next_src"][start:end]],
+                    "dst": [event_ids[p] for p in edges["next_dst"][start:end]]
+                }
+            ))
+
+        for start in range(0, len(edges["qdep_src"]), WRITE_CHUNK_SIZE):
+            end = start + WRITE_CHUNK_SIZE
+            statements.append((
+                """
+                UNWIND range(0, size($src) - 1) AS i
+                MATCH (a:Event {execution_id: $execution_id, event_id: $src[i]})
+                MATCH (b:Event {execution_id: $execution_id, event_id: $dst[i]})
+                CREATE (a)-[:QUBIT_DEP {qubits: $qubits[i]}]->(b)
+                """,
+                {
+                    "src": [event_ids[p] for p in edges["qdep_src"][start:end]],
+                    "dst": [event_ids[p] for p in edges["qdep_dst"][start:end]],
+                    "qubits": edges["qdep_qubits"][start:end]
+                }
+            ))
+
+        # There is always at least one event chunk; the last statement also sets the times
+        *leading, (last_query, last_parameters) = statements
+        for query, parameters in leading:
+            tx.run(query, execution_id=execution_id, **parameters)
+
+        result = tx.run(
+            last_query + """
+            WITH count(*) AS written
+            MATCH (x:Execution {execution_id: $execution_id})
+            WITH x, $started AS started
+            """ + SET_PERSISTENCE_TIMES,
+            execution_id=execution_id,
+            started=started,
+            **last_parameters
+        )
+        return result.single().data()
 
     # ==================== READ OPERATIONS ====================
 
     def get_total_executions_count(self) -> int:
-        """Get total count of unique executions."""
+        """Get total count of executions (answered from Neo4j's count store, no scan)."""
         query = """
-            MATCH (e:Event)
-            WITH DISTINCT e.execution_id AS exec_id
-            RETURN count(exec_id) AS total
+            MATCH (x:Execution)
+            RETURN count(x) AS total
         """
-        result = self._execute_query(query)
+        result = self._cached(self._list_cache, ("count",), lambda: self._execute_query(query))
         return result[0]["total"] if result else 0
 
-    def get_executions_paginated(self, skip: int, limit: int) -> List[Dict]:
-        """Get paginated list of executions ordered by most recent (from Execution node)."""
+    def get_executions_paginated(
+        self,
+        skip: int,
+        limit: int,
+        before: Optional[Tuple[str, str]] = None
+    ) -> List[Dict]:
+        """
+        Get paginated list of executions ordered by most recent (from Execution node).
+        With before (the ISO 8601 created_at and execution_id of the last row seen),
+        pages by key instead: the page starts after that execution, so the index
+        seek replaces skipping earlier rows. execution_id breaks ties between
+        executions created at the same time, so none are skipped at a page boundary.
+        Events are only counted for the executions on the page, and each row
+        comes back already shaped as an executions list item.
+        """
         query = """
             MATCH (x:Execution)
-            OPTIONAL MATCH (x)-[:HAS_EVENT]->(e:Event)
-            WITH x, count(e) AS num_events
-            RETURN x.execution_id AS execution_id,
-                   x.circuit_name AS circuit_name,
-                   x.total_observability_time_ms AS total_time,
-                   x.created_at AS created_at,
-                   x.event_extraction_time_ms AS event_extraction_time_ms,
-                   x.in_memory_graph_time_ms AS in_memory_graph_time_ms,
-                   x.neo4j_persistence_time_ms AS neo4j_persistence_time_ms,
-                   x.is_noisy AS is_noisy,
-                   x.noise_type AS noise_type,
-                   x.noise_level AS noise_level,
-                   num_events
-            ORDER BY x.created_at DESC
+            %s
+            WITH x ORDER BY x.created_at DESC, x.execution_id DESC
             SKIP $skip
             LIMIT $limit
-        """
-        return self._execute_query(query, {"skip": skip, "limit": limit})
+            OPTIONAL MATCH (x)-[:HAS_EVENT]->(e:Event)
+            WITH x, count(e) AS num_events
+            WITH x, {
+                execution_id: x.execution_id,
+                circuit_name: x.circuit_name,
+                num_events: num_events,
+                event_count: num_events,
+                time: x.total_observability_time_ms,
+                created_at: x.created_at,
+                is_noisy: coalesce(x.is_noisy, false)
+            } AS row
+            RETURN CASE WHEN row.is_noisy
+                        THEN row {.*, noise_config: {noise_type: x.noise_type, noise_level: x.noise_level}}
+                        ELSE row END AS row
+            ORDER BY x.created_at DESC, x.execution_id DESC
+        """ % ("""
+            WHERE x.created_at <= datetime($before_created_at)
+              AND (x.created_at < datetime($before_created_at) OR x.execution_id < $before_execution_id)
+        """ if before else "")
+        before_created_at, before_execution_id = before or (None, None)
+        return self._cached(
+            self._list_cache,
+            ("page", skip, limit, before),
+            lambda: [r["row"] for r in self._execute_query(query, {
+                "skip": skip,
+                "limit": limit,
+                "before_created_at": before_created_at,
+                "before_execution_id": before_execution_id
+            })]
+        )
 
     def get_execution_by_id(self, execution_id: str) -> Optional[Dict]:
         """Get execution overview by ID, including performance stats and noise config."""
@@ -239,12 +612,83 @@ class Neo4jStore:
                 x.two_gate_error AS two_gate_error,
                 x.measurement_error AS measurement_error
         """
+        def load():
+            result = self._execute_query(query, {"execution_id": execution_id})
+            return result[0] if result and result[0].get("execution_id") else None
+
+        return self._cached(self._execution_cache, ("execution", execution_id), load)
+
+    def get_execution_created_at(self, execution_id: str) -> Optional[Any]:
+        """Get only the creation timestamp of an execution (cheap existence/version check)."""
+        query = """
+            MATCH (x:Execution {execution_id: $execution_id})
+            RETURN x.created_at AS created_at
+        """
         result = self._execute_query(query, {"execution_id": execution_id})
-        return result[0] if result and result[0].get("execution_id") else None
+        return result[0]["created_at"] if result else None
 
     def get_execution_graph(self, execution_id: str) -> Dict[str, List[Dict]]:
-        """Get event nodes and edges (NEXT + QUBIT_DEP) for graph visualization."""
-        nodes_query = """
+        """Get event nodes and edges (NEXT + QUBIT_DEP) for graph visualization in one query."""
+        query = GRAPH_SUBQUERIES + """
+            RETURN nodes, next_edges + qubit_dep_edges AS edges
+        """
+
+        def load():
+            result = self._execute_query(query, {"execution_id": execution_id})
+            return result[0] if result and result[0]["nodes"] else None
+
+        return self._cached(self._execution_cache, ("graph", execution_id), load) or {"nodes": [], "edges": []}
+
+    def get_execution_with_graph(self, execution_id: str) -> Tuple[Optional[Dict], Dict[str, List[Dict]]]:
+        """
+        Get execution metadata (as get_execution_by_id) and graph (as get_execution_graph) in one query.
+        Served from the read cache when both are there; a query fills both.
+        """
+        with self._cache_lock:
+            metadata = self._execution_cache.get(("execution", execution_id))
+            graph = self._execution_cache.get(("graph", execution_id))
+        if metadata is not None and graph is not None:
+            return metadata, graph
+
+        query = GRAPH_SUBQUERIES + """
+            OPTIONAL MATCH (x:Execution {execution_id: $execution_id})
+            RETURN nodes,
+                   next_edges + qubit_dep_edges AS edges,
+                   x {
+                       .execution_id,
+                       .circuit_name,
+                       num_events: size(nodes),
+                       last_timestamp: nodes[-1].timestamp,
+                       .event_extraction_time_ms,
+                       .in_memory_graph_time_ms,
+                       .neo4j_persistence_time_ms,
+                       .total_observability_time_ms,
+                       .created_at,
+                       .is_noisy,
+                       .noise_type,
+                       .noise_level,
+                       .single_gate_error,
+                       .two_gate_error,
+                       .measurement_error
+                   } AS metadata
+        """
+        result = self._execute_query(query, {"execution_id": execution_id})
+        if not result:
+            return None, {"nodes": [], "edges": []}
+
+        row = result[0]
+        metadata = row["metadata"]
+        graph = {"nodes": row["nodes"], "edges": row["edges"]}
+        with self._cache_lock:
+            if metadata:
+                self._execution_cache[("execution", execution_id)] = metadata
+            if graph["nodes"]:
+                self._execution_cache[("graph", execution_id)] = graph
+        return metadata, graph
+
+    def iter_execution_nodes(self, execution_id: str) -> Iterator[Dict]:
+        """Lazily yield event nodes ordered by timestamp."""
+        query = """
             MATCH (e:Event {execution_id: $execution_id})
             RETURN e.event_id AS id,
                    e.event_type AS type,
@@ -253,27 +697,66 @@ class Neo4jStore:
                    e.timestamp AS timestamp
             ORDER BY e.timestamp
         """
-        # Get NEXT edges (temporal)
-        next_edges_query = """
+        return self._iter_query(query, {"execution_id": execution_id})
+
+    def iter_execution_edges(self, execution_id: str) -> Iterator[Dict]:
+        """Lazily yield NEXT edges followed by QUBIT_DEP edges."""
+        # NEXT edges (temporal), then QUBIT_DEP edges (data-flow), in one query
+        # so the whole stream runs in one session. The branches return maps
+        # because only QUBIT_DEP edges carry qubits.
+        query = """
             MATCH (a:Event {execution_id: $execution_id})-[:NEXT]->(b:Event)
-            RETURN a.event_id AS source,
-                   b.event_id AS target,
-                   'NEXT' AS relation
-        """
-        # Get QUBIT_DEP edges (data-flow)
-        qubit_dep_edges_query = """
+            RETURN {source: a.event_id, target: b.event_id, relation: 'NEXT'} AS edge
+            UNION ALL
             MATCH (a:Event {execution_id: $execution_id})-[r:QUBIT_DEP]->(b:Event)
-            RETURN a.event_id AS source,
-                   b.event_id AS target,
-                   'QUBIT_DEP' AS relation,
-                   r.qubits AS qubits
-        """
-        params = {"execution_id": execution_id}
-        
-        next_edges = self._execute_query(next_edges_query, params)
-        qubit_dep_edges = self._execute_query(qubit_dep_edges_query, params)
-        
-        return {
-            "nodes": self._execute_query(nodes_query, params),
-            "edges": next_edges + qubit_dep_edges
-        }
+            RETURN {source: a.event_id, target: b.event_id, relation: 'QUBIT_DEP', qubits: r.qubits} AS edge
+        """
+        return (record["edge"] for record in self._iter_query(query, {"execution_id": execution_id}))
+
+    def get_execution_step(self, execution_id: str, step_index: int) -> Optional[Dict]:
+        """
+        Get a single replay step plus the total step count and execution metadata in one query.
+        The step is None when step_index is past the last event.
+        """
+        query = """
+            MATCH (e:Event {execution_id: $execution_id})
+            WITH e ORDER BY e.timestamp
+            WITH collect(e) AS events
+            OPTIONAL MATCH (x:Execution {execution_id: $execution_id})
+            WITH x, size(events) AS total_steps, events[$step_index] AS e
+            RETURN total_steps,
+                   e {id: e.event_id,
+                      type: e.event_type,
+                      gate: e.gate_name,
+                      qubits: e.qubits,
+                      timestamp: e.timestamp} AS step,
+                   x {.circuit_name, .is_noisy, .noise_type, .noise_level} AS metadata
+        """
+        result = self._execute_query(query, {"execution_id": execution_id, "step_index": step_index})
+        return result[0] if result else None
+
+    def get_replays(self, execution_ids: List[str]) -> List[Dict]:
+        """
+        Get ordered replay steps and metadata for several executions in one round-trip.
+        Returns one row per requested ID; steps is empty for unknown executions.
+        """
+        query = """
+            UNWIND $execution_ids AS execution_id
+            CALL {
+                WITH execution_id
+                MATCH (e:Event {execution_id: execution_id})
+                WITH e ORDER BY e.timestamp
+                RETURN collect({
+                    id: e.event_id,
+                    type: e.event_type,
+                    gate: e.gate_name,
+                    qubits: e.qubits,
+                    timestamp: e.timestamp
+                }) AS steps
+            }
+            OPTIONAL MATCH (x:Execution {execution_id: execution_id})
+            RETURN execution_id,
+                   steps,
+                   x {.circuit_name, .is_noisy, .noise_type, .noise_level} AS metadata
+        """
+        return self._execute_query(query, {"execution_ids": execution_ids})
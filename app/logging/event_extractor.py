@@ -1,26 +1,25 @@
 from app.logging.event_schema import GateEvent, MeasurementEvent, Event
 
 def extract_events(qc):
-    events = []
-    event_id = 0
-    time = 0
+    # Bit -> index maps, built once instead of a find_bit call per bit
+    qubit_index = {q: i for i, q in enumerate(qc.qubits)}
+    clbit_index = {c: i for i, c in enumerate(qc.clbits)}
 
     # Execution start
-    events.append(Event(event_id, "EXECUTION_START", time))
-    event_id += 1
-    time += 1
+    events = [Event(0, "EXECUTION_START", 0)]
 
-    for instr in qc.data:
+    # Event IDs double as logical timestamps, one per instruction
+    for event_id, instr in enumerate(qc.data, start=1):
         op = instr.operation
-        qubits = [qc.find_bit(q).index for q in instr.qubits]
+        qubits = [qubit_index[q] for q in instr.qubits]
 
         if op.name == "measure":
-            clbits = [qc.find_bit(c).index for c in instr.clbits]
+            clbits = [clbit_index[c] for c in instr.clbits]
             events.append(
                 MeasurementEvent(
                     event_id,
                     "MEASUREMENT",
-                    time,
+                    event_id,
                     qubits,
                     clbits
                 )
@@ -30,16 +29,14 @@ def extract_events(qc):
                 GateEvent(
                     event_id,
                     "GATE",
-                    time,
+                    event_id,
                     op.name.upper(),
                     qubits
                 )
             )
 
-        event_id += 1
-        time += 1
-
     # Execution end
-    events.append(Event(event_id, "EXECUTION_END", time))
+    end_id = len(events)
+    events.append(Event(end_id, "EXECUTION_END", end_id))
 
     return events
@@ -1,19 +1,33 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     event_id: int
     event_type: str
     timestamp: int
 
-@dataclass
+    # Attributes only some event types carry. Every event exposes them (None
+    # when not applicable) so readers use plain attribute loads instead of
+    # hasattr probes. Class attributes, not fields: to_dict is unaffected.
+    gate_name = None
+    qubits = None
+    classical_bits = None
+
+    def to_dict(self) -> dict:
+        # __match_args__ lists the dataclass fields in order; slotted
+        # instances have no __dict__ to hand out.
+        return {name: getattr(self, name) for name in self.__match_args__}
+
+# field() keeps these required; a bare annotation would inherit the
+# None defaults declared on Event.
+@dataclass(slots=True)
 class GateEvent(Event):
-    gate_name: str
-    qubits: List[int]
+    gate_name: str = field()
+    qubits: List[int] = field()
 
-@dataclass
+@dataclass(slots=True)
 class MeasurementEvent(Event):
-    qubits: List[int]
-    classical_bits: List[int]
+    qubits: List[int] = field()
+    classical_bits: List[int] = field()
     outcome: Optional[str] = None
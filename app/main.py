@@ -1,44 +1,111 @@
+import asyncio
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
-import subprocess
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 from app.api.routes import router
 from app.api.execution_routes import router as execution_router
 from app.api.replay_routes import router as replay_router
+from app.quantum.runner import shutdown_simulation_pool, warm_up_simulation_pool
+from app.core.dependencies import get_neo4j_store
+from app.graph.neo4j_store import MAX_CONNECTION_POOL_SIZE
+from app.core.responses import ORJSONResponse
+from app.services.execution_query_service import ExecutionQueryService
+from app.replay.replay_engine import ReplayEngine
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 load_dotenv()
 
-app = FastAPI(title="Event-Graph Quantum Backend")
+
+def _read_commit_id() -> str:
+    """
+    Resolve the deployed git commit without spawning git: GIT_COMMIT if set
+    (e.g. at image build), otherwise read from the .git directory.
+    """
+    commit_id = os.getenv("GIT_COMMIT")
+    if commit_id:
+        return commit_id.strip()
+
+    git_dir = Path(__file__).resolve().parent.parent / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head  # detached HEAD holds the hash itself
+        ref = head[len("ref: "):]
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+        # Refs may only be listed in packed-refs ("<hash> <ref>" per line)
+        for line in (git_dir / "packed-refs").read_text().splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return "unknown"
+
+
+# The commit cannot change while the process runs, so resolve it once
+COMMIT_ID = _read_commit_id()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync routes and dependencies run on anyio's worker threads (40 by
+    # default); allow one per pooled Neo4j connection so the pool, not the
+    # thread limit, bounds concurrent database work
+    to_thread.current_default_thread_limiter().total_tokens = MAX_CONNECTION_POOL_SIZE
+    # Query service and replay engine are stateless wrappers around the
+    # shared store, so one instance of each serves every request
+    store = get_neo4j_store()
+    app.state.execution_service = ExecutionQueryService(store)
+    app.state.replay_engine = ReplayEngine(store) if store else None
+    # Connect to Neo4j and set up its schema in the background so neither
+    # startup nor the first request waits on the database
+    app.state.neo4j_warm_up = asyncio.create_task(asyncio.to_thread(store.warm_up)) if store else None
+    # Likewise start the simulator worker processes, which each import qiskit_aer
+    app.state.simulation_warm_up = asyncio.create_task(asyncio.to_thread(warm_up_simulation_pool))
+    yield
+    # Stop simulator worker processes on shutdown
+    shutdown_simulation_pool()
+
+
+app = FastAPI(
+    title="Event-Graph Quantum Backend",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware - origins from environment variable
 allowed_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+# Request headers the frontend may send; CORS_HEADERS replaces the list
+allowed_headers = os.getenv(
+    "CORS_HEADERS", "Authorization,Content-Type,If-None-Match,X-Requested-With"
+).split(",")
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Concrete lists let Starlette answer preflights with fixed headers instead
+    # of echoing each request's
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=allowed_headers,
 )
+# Compress large JSON payloads (replays, graphs, comparisons); level 4 keeps CPU cost low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
 app.include_router(router)
 app.include_router(execution_router)
 app.include_router(replay_router)
 
 @app.get("/")
-def health():
+async def health():
     return {"status": "ok"}
 
 @app.get("/status")
-def status():
+async def status():
     """
     this function return the last git commit hash """
-    try:
-        commit_id = (
-            subprocess.check_output(["git", "rev-parse", "HEAD"])
-            .decode("utf-8")
-            .strip()
-        )
-        return commit_id
-    except Exception:
-        return "unknown"
\ No newline at end of file
+    return COMMIT_ID
@@ -3,6 +3,7 @@ Noise models for quantum circuit simulation.
 Provides configurable noise models using Qiskit Aer.
 """
 
+from functools import lru_cache
 from qiskit_aer.noise import NoiseModel, depolarizing_error, thermal_relaxation_error
 from typing import Optional, Dict, Any
 
@@ -159,3 +160,25 @@ def get_noise_model(
         return create_thermal_noise_model(config), config
     else:
         raise ValueError(f"Unknown noise type: {noise_type}. Choose 'depolarizing' or 'thermal'")
+
+
+@lru_cache(maxsize=None)
+def get_cached_noise_model(noise_type: str, level: str) -> tuple[NoiseModel, NoiseConfig]:
+    """
+    Shared noise model for a predefined type and level.
+    
+    Building a NoiseModel takes milliseconds and the result depends only on
+    these two arguments, so each combination is built once. The returned
+    objects are shared between requests and must not be modified.
+    """
+    return get_noise_model(noise_type, level)
+
+
+@lru_cache(maxsize=None)
+def get_cached_noise_config_dict(noise_type: str, level: str) -> Dict[str, Any]:
+    """
+    Shared to_dict() of the cached config for a predefined type and level,
+    as reported in responses and stored with executions. Must not be modified.
+    """
+    _, noise_config = get_cached_noise_model(noise_type, level)
+    return noise_config.to_dict(noise_type=noise_type, noise_level=level)
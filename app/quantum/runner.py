@@ -1,7 +1,20 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from qiskit_aer import AerSimulator
 from qiskit_aer.noise import NoiseModel
 from typing import Optional, Dict
 
+logger = logging.getLogger(__name__)
+
+# Simulations are CPU-bound, so they run in worker processes rather than
+# threads to scale across cores instead of contending for the GIL.
+_simulation_pool: Optional[ProcessPoolExecutor] = None
+_simulation_pool_lock = threading.Lock()
+
 
 def run_circuit(qc, shots: int = 1024, noise_model: Optional[NoiseModel] = None) -> Dict[str, int]:
     """
@@ -19,3 +32,83 @@ def run_circuit(qc, shots: int = 1024, noise_model: Optional[NoiseModel] = None)
     result = sim.run(qc, shots=shots).result()
     return result.get_counts()
 
+
+def _load_simulator() -> None:
+    """Runs in each worker at startup; importing this module loads qiskit_aer."""
+    AerSimulator()
+
+
+@lru_cache(maxsize=1)
+def get_simulation_worker_count() -> int:
+    """
+    Number of simulation workers: the CPUs this process may run on, capped by
+    the SIMULATION_WORKERS environment variable. Each worker imports qiskit_aer,
+    so memory limits (or a CPU quota, which affinity does not show) may call for
+    fewer. Invalid values are logged and ignored. Read once.
+    """
+    try:
+        # Honours container cpusets and taskset, unlike os.cpu_count()
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS and Windows
+        cpus = os.cpu_count() or 1
+
+    limit = os.getenv("SIMULATION_WORKERS", "").strip()
+    if not limit:
+        return cpus
+    try:
+        workers = int(limit)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning(f"Ignoring SIMULATION_WORKERS={limit!r}: expected a positive integer")
+        return cpus
+    return min(cpus, workers)
+
+
+def get_simulation_pool() -> ProcessPoolExecutor:
+    """Get or create the shared simulation process pool."""
+    global _simulation_pool
+    
+    with _simulation_pool_lock:
+        if _simulation_pool is None:
+            # spawn rather than fork: workers must not inherit the server's threads and sockets
+            _simulation_pool = ProcessPoolExecutor(
+                max_workers=get_simulation_worker_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    return _simulation_pool
+
+
+def warm_up_simulation_pool() -> None:
+    """
+    Start every worker process and load the simulator in it. Meant to run
+    once at startup, so the first execution does not pay for spawning workers.
+    """
+    pool = get_simulation_pool()
+    try:
+        # Submitted back to back, so each lands on a newly spawned worker
+        futures = [pool.submit(_load_simulator) for _ in range(get_simulation_worker_count())]
+        for future in futures:
+            future.result()
+    except Exception as e:
+        logger.warning(f"Simulation pool warm-up failed: {e}")
+
+
+def shutdown_simulation_pool() -> None:
+    """Stop the simulation worker processes, if any were started."""
+    global _simulation_pool
+    
+    with _simulation_pool_lock:
+        if _simulation_pool is not None:
+            _simulation_pool.shutdown(cancel_futures=True)
+            _simulation_pool = None
+
+
+def submit_circuit(qc, shots: int = 1024, noise_model: Optional[NoiseModel] = None) -> "Future[Dict[str, int]]":
+    """
+    Start running a quantum circuit in the simulation process pool.
+    Returns a future for the counts, so the caller can do other work meanwhile.
+    """
+    return get_simulation_pool().submit(run_circuit, qc, shots, noise_model)
+
@@ -19,30 +19,28 @@ def compare_execution_sequences(exec_a: List[Dict], exec_b: List[Dict]) -> Dict:
 
     min_len = min(len(exec_a), len(exec_b))
 
-    for i in range(min_len):
-        event_a = exec_a[i]
-        event_b = exec_b[i]
-        
-        # Get event properties safely using .get()
-        type_a = event_a.get("type")
-        type_b = event_b.get("type")
-        gate_a = event_a.get("gate")
-        gate_b = event_b.get("gate")
-        qubits_a = event_a.get("qubits")
-        qubits_b = event_b.get("qubits")
-        
-        # Check for differences in type, gate, or qubits
-        if type_a != type_b or gate_a != gate_b or qubits_a != qubits_b:
-            diffs.append({
-                "step": i,
-                "difference": {
-                    "type": type_a != type_b,
-                    "gate": gate_a != gate_b,
-                    "qubits": qubits_a != qubits_b
-                },
-                "exec_a": event_a,
-                "exec_b": event_b
-            })
+    for i, (event_a, event_b) in enumerate(zip(exec_a, exec_b)):
+        # Identical events (the common case in replays) are skipped with a
+        # single C-level dict comparison
+        if event_a == event_b:
+            continue
+
+        # Compare only type, gate name and qubits; .get() tolerates missing keys
+        key_a = (event_a.get("type"), event_a.get("gate"), event_a.get("qubits"))
+        key_b = (event_b.get("type"), event_b.get("gate"), event_b.get("qubits"))
+        if key_a == key_b:
+            continue
+
+        diffs.append({
+            "step": i,
+            "difference": {
+                "type": key_a[0] != key_b[0],
+                "gate": key_a[1] != key_b[1],
+                "qubits": key_a[2] != key_b[2]
+            },
+            "exec_a": event_a,
+            "exec_b": event_b
+        })
 
     return {
         "divergence_count": len(diffs),
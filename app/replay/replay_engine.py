@@ -43,8 +43,8 @@ class ReplayEngine:
         Returns:
             Dict with steps, metadata, and edges, or None if not found.
         """
-        graph = self.store.get_execution_graph(execution_id)
-        metadata = self.store.get_execution_by_id(execution_id)
+        # Metadata and graph in one round-trip
+        metadata, graph = self.store.get_execution_with_graph(execution_id)
         
         if not graph or "nodes" not in graph or not graph["nodes"]:
             return None
@@ -55,21 +55,47 @@ class ReplayEngine:
             "metadata": metadata
         }
 
+    def replay_many(self, execution_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Return replay sequences for several executions using a single query.
+        
+        Returns:
+            Dict mapping each execution ID to a dict with steps and metadata,
+            or to None if that execution was not found.
+        """
+        rows = self.store.get_replays(execution_ids)
+        
+        return {
+            row["execution_id"]: {
+                "steps": row["steps"],
+                "metadata": row["metadata"]
+            } if row["steps"] else None
+            for row in rows
+        }
+
+    def get_step(self, execution_id: str, step_index: int) -> Optional[Tuple[Optional[Dict], int, Dict]]:
+        """
+        Return a single replay step without loading the full sequence.
+        
+        Returns:
+            Tuple of (event, total_steps, metadata), or None if execution not found.
+            Event is None when step_index is out of range.
+        """
+        result = self.store.get_execution_step(execution_id, step_index)
+        
+        if not result or not result["total_steps"]:
+            return None
+        
+        return result["step"], result["total_steps"], result["metadata"] or {}
+
     def replay_stepwise(self, execution_id: str) -> Generator[Dict, None, None]:
         """
         Generator that yields one event at a time (step-by-step replay).
         
         Yields:
-            Event nodes one at a time.
+            Event nodes one at a time, streamed from Neo4j as they are consumed.
             
         Note:
             Yields nothing if execution not found.
         """
-        graph = self.store.get_execution_graph(execution_id)
-        nodes = graph.get("nodes") if graph else None
-        
-        if not nodes:
-            return
-            
-        for node in nodes:
-            yield node
+        yield from self.store.iter_execution_nodes(execution_id)
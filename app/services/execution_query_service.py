@@ -3,9 +3,36 @@ Service layer for execution query operations.
 Handles business logic for retrieving execution data from Neo4j.
 """
 
-from typing import Optional, Dict, List, Any
+from datetime import datetime
+from typing import Optional, Dict, List, Any, Iterator, Sequence, Tuple
+from neo4j.time import DateTime
 from app.graph.neo4j_store import Neo4jStore
 
+# Attributes of a graph node, in response order
+GRAPH_NODE_FIELDS = ("id", "type", "gate", "qubits", "timestamp")
+
+# Timestamp types the driver returns for created_at
+DATETIME_TYPES = (datetime, DateTime)
+
+
+def encode_cursor(created_at: str, execution_id: str) -> str:
+    """Build a list cursor from the created_at and execution_id of a page's last row."""
+    return f"{created_at},{execution_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Split a list cursor into (created_at, execution_id).
+
+    Raises:
+        ValueError: If the cursor is not an ISO 8601 datetime and an execution ID
+    """
+    created_at, _, execution_id = cursor.rpartition(",")
+    if not execution_id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    datetime.fromisoformat(created_at)
+    return created_at, execution_id
+
 
 class ExecutionQueryService:
     """Service for querying quantum execution data."""
@@ -18,53 +45,64 @@ class ExecutionQueryService:
         """Check if the service is available."""
         return self._store is not None and self._store.is_available()
 
-    def list_executions(self, page: int = 1, limit: int = 10) -> Dict[str, Any]:
+    def list_executions(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        cursor: Optional[Tuple[str, str]] = None
+    ) -> Dict[str, Any]:
         """
         Get paginated list of quantum executions from Neo4j Execution node.
+        With cursor (a decoded next_cursor of a previous page), the page continues
+        after that execution; page is ignored and returned as None.
         """
         if not self._store:
             raise RuntimeError("Neo4j not configured")
 
-        skip = (page - 1) * limit
+        skip = 0 if cursor else (page - 1) * limit
         total = self._store.get_total_executions_count()
-        executions = self._store.get_executions_paginated(skip, limit)
-
-        enriched = []
-        for e in executions:
-            # Format created_at datetime properly
-            created_at = e.get("created_at")
-            if created_at and hasattr(created_at, 'isoformat'):
-                created_at = created_at.isoformat()
-
-            item = {
-                "execution_id": e.get("execution_id"),
-                "circuit_name": e.get("circuit_name"),
-                "num_events": e.get("num_events"),
-                "event_count": e.get("num_events"),
-                "time": e.get("total_time"),
-                "created_at": created_at,
-                "is_noisy": e.get("is_noisy", False),
-            }
-
-            # Group noise config if execution is noisy
-            if e.get("is_noisy"):
-                item["noise_config"] = {
-                    "noise_type": e.get("noise_type"),
-                    "noise_level": e.get("noise_level"),
-                }
-
-            enriched.append(item)
+        executions = self._store.get_executions_paginated(skip, limit, before=cursor)
+
+        enriched = [self._format_execution_row(e) for e in executions]
+
+        # Only a full page can have more after it
+        next_cursor = None
+        if len(enriched) == limit:
+            last = enriched[-1]
+            next_cursor = encode_cursor(last["created_at"], last["execution_id"])
 
         return {
-            "page": page,
+            "page": None if cursor else page,
             "limit": limit,
             "total": total,
-            "executions": enriched
+            "executions": enriched,
+            "next_cursor": next_cursor
         }
 
-    def get_execution_overview(self, execution_id: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _format_execution_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Finish one get_executions_paginated row (already shaped by the query)."""
+        # Rows are shared with the store's cache, so convert created_at on a copy
+        created_at = row["created_at"]
+        if isinstance(created_at, DATETIME_TYPES):
+            return {**row, "created_at": created_at.isoformat()}
+        return row
+
+    def get_execution_overview(self, execution_id: str, include_graph: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get execution summary, performance stats, and graph data from Neo4j.
+        With include_graph=False the graph is neither fetched nor returned.
+        """
+        summary = self.get_execution_summary(execution_id)
+        if not summary or not include_graph:
+            return summary
+
+        return self.build_overview(summary, self.get_execution_graph(execution_id))
+
+    def get_execution_summary(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get execution summary and performance stats, without graph data.
+        Returns None if the execution does not exist.
         """
         if not self._store:
             raise RuntimeError("Neo4j not configured")
@@ -74,44 +112,40 @@ class ExecutionQueryService:
         if not basic:
             return None
 
-        # Graph data from Neo4j
-        graph = self._store.get_execution_graph(execution_id)
-
         # Format created_at datetime properly
         created_at = basic.get("created_at")
-        if created_at and hasattr(created_at, 'isoformat'):
+        if isinstance(created_at, DATETIME_TYPES):
             created_at = created_at.isoformat()
 
-        # Build clean response with grouped noise_config
-        overview = {
+        is_noisy = basic.get("is_noisy", False)
+
+        # Build the whole response in one literal, noise_config only if noisy
+        return {
             "execution_id": basic.get("execution_id"),
             "circuit_name": basic.get("circuit_name"),
             "num_events": basic.get("num_events"),
             "last_timestamp": basic.get("last_timestamp"),
             "created_at": created_at,
-            "is_noisy": basic.get("is_noisy", False),
-        }
-
-        # Group noise config if execution is noisy
-        if basic.get("is_noisy"):
-            overview["noise_config"] = {
+            "is_noisy": is_noisy,
+            **({"noise_config": {
                 "noise_type": basic.get("noise_type"),
                 "noise_level": basic.get("noise_level"),
                 "single_gate_error": basic.get("single_gate_error"),
                 "two_gate_error": basic.get("two_gate_error"),
                 "measurement_error": basic.get("measurement_error"),
-            }
-
-        # Performance stats
-        overview["performance_stats"] = {
-            "event_extraction_time_ms": basic.get("event_extraction_time_ms"),
-            "in_memory_graph_time_ms": basic.get("in_memory_graph_time_ms"),
-            "neo4j_persistence_time_ms": basic.get("neo4j_persistence_time_ms"),
-            "total_observability_time_ms": basic.get("total_observability_time_ms"),
+            }} if is_noisy else {}),
+            "performance_stats": {
+                "event_extraction_time_ms": basic.get("event_extraction_time_ms"),
+                "in_memory_graph_time_ms": basic.get("in_memory_graph_time_ms"),
+                "neo4j_persistence_time_ms": basic.get("neo4j_persistence_time_ms"),
+                "total_observability_time_ms": basic.get("total_observability_time_ms"),
+            },
         }
 
-        overview["graph"] = graph
-        return overview
+    @staticmethod
+    def build_overview(summary: Dict[str, Any], graph: Dict[str, List[Dict]]) -> Dict[str, Any]:
+        """Merge an execution summary with its graph data into the overview response."""
+        return {**summary, "graph": graph}
 
     def get_execution_graph(self, execution_id: str) -> Dict[str, List[Dict]]:
         """
@@ -130,3 +164,44 @@ class ExecutionQueryService:
             raise RuntimeError("Neo4j not configured")
 
         return self._store.get_execution_graph(execution_id)
+
+    def iter_execution_graph(
+        self,
+        execution_id: str,
+        node_fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, Iterator[Dict]]:
+        """
+        Get event dependency graph as lazy record iterators.
+        
+        Nodes and edges are pulled from Neo4j only as the caller consumes them,
+        so large graphs can be streamed without holding them in memory.
+        
+        Args:
+            execution_id: UUID of the execution
+            node_fields: Node attributes to keep (subset of GRAPH_NODE_FIELDS);
+                all attributes when None
+            
+        Raises:
+            RuntimeError: If Neo4j is not configured
+            ServiceUnavailable: If Neo4j cannot be reached
+        """
+        if not self._store:
+            raise RuntimeError("Neo4j not configured")
+
+        # Both queries are sent here, so connection errors reach the caller
+        # before any of the response is written
+        node_records = self._store.iter_execution_nodes(execution_id)
+        try:
+            edges = self._store.iter_execution_edges(execution_id)
+        except BaseException:
+            node_records.close()
+            raise
+
+        nodes = node_records
+        if node_fields is not None:
+            nodes = ({field: node[field] for field in node_fields} for node in node_records)
+
+        return {
+            "nodes": nodes,
+            "edges": edges
+        }
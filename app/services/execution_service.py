@@ -1,32 +1,20 @@
-import os
+import logging
 import time
 import uuid
 from typing import Optional, Dict, Any
-from app.quantum.runner import run_circuit
-from app.quantum.noise_models import get_noise_model, NoiseConfig
+from app.quantum.runner import submit_circuit
+from app.quantum.noise_models import get_cached_noise_model, get_cached_noise_config_dict, NoiseConfig
 from app.logging.event_extractor import extract_events
 from app.graph.graph_builder import build_event_graph
-from app.graph.neo4j_store import Neo4jStore
-from dotenv import load_dotenv
+from app.core.dependencies import get_neo4j_store
 
-# Load .env from project root (searches up the directory tree)
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-neo4j_uri = os.getenv("NEO4J_URL", "")
-neo4j_user = os.getenv("NEO4J_USERNAME", "neo4j")
-neo4j_password = os.getenv("NEO4J_PASSWORD", "")
-print(neo4j_uri, neo4j_user, neo4j_password)
-# Initialize Neo4j only if credentials are provided
-neo4j_store = None
-if neo4j_uri and neo4j_user and neo4j_password:
-    neo4j_store = Neo4jStore(
-        uri=neo4j_uri,
-        user=neo4j_user,
-        password=neo4j_password
-    )
-    print("Neo4j connection initialized")
-else:
-    print("Warning: Neo4j connection details not set. Running without Neo4j integration.")
+# Share the application's store, so executions are written through the same
+# driver and connection pool the read endpoints use (and invalidate their cache)
+neo4j_store = get_neo4j_store()
+if neo4j_store is None:
+    logger.warning("Neo4j connection details not set. Running without Neo4j integration.")
 
 
 def execute_with_observability(
@@ -46,83 +34,82 @@ def execute_with_observability(
         noise_level: Noise level ("low", "medium", "high", "very_high")
         
     Returns:
-        Execution results with metrics, events, and graph data
+        Execution results with metrics, events, and graph data. events, nodes
+        and edges are iterators, so each record is only built while the
+        response is being encoded.
     """
     # Get noise model if specified
     noise_model = None
     noise_config_dict = None
     if noise_type:
-        noise_model, noise_config = get_noise_model(noise_type, noise_level)
-        noise_config_dict = noise_config.to_dict(noise_type=noise_type, noise_level=noise_level)
+        noise_model, _ = get_cached_noise_model(noise_type, noise_level)
+        noise_config_dict = get_cached_noise_config_dict(noise_type, noise_level)
         name = f"{name}_noisy_{noise_type}_{noise_level}"
     
-    counts = run_circuit(qc, noise_model=noise_model)
+    # The simulation runs in a worker process while the event graph is built
+    # here; the graph does not depend on the counts
+    counts_future = submit_circuit(qc, noise_model=noise_model)
     
     execution_id = str(uuid.uuid4())
 
-    t1 = time.perf_counter()
+    t1 = time.perf_counter_ns()
     events = extract_events(qc)
-    t2 = time.perf_counter()
+    t2 = time.perf_counter_ns()
 
-    graph = build_event_graph(events)
-    t3 = time.perf_counter()
+    graph = build_event_graph(events, qc.num_qubits)
+    t3 = time.perf_counter_ns()
 
-    # Calculate performance metrics
-    event_time = t2 - t1
-    graph_time = t3 - t2
-    t4 = None
-    neo4j_time = None
-    total_time = None
+    # Calculate performance metrics (integer nanoseconds, reported in ms)
+    event_time_ms = round((t2 - t1) / 1e6, 4)
+    graph_time_ms = round((t3 - t2) / 1e6, 4)
 
     # Prepare noise config for storage (already includes type and level)
     noise_config_for_storage = noise_config_dict
 
+    # Only store the execution once the simulation succeeded, so a failed
+    # run does not leave an execution behind that has no result
+    counts = counts_future.result()
+
+    t4 = time.perf_counter_ns()
+    stored_times = None
     if neo4j_store:
-        t3a = time.perf_counter()
-        neo4j_store.store_event_graph(
-            events=events,
+        # Persistence and total times are measured by the write on the server
+        # and saved with the Execution node; the response reports the same values
+        stored_times = neo4j_store.store_event_graph(
             execution_id=execution_id,
-            edges=list(graph.edges(data=True)),
+            graph=graph,
             circuit_name=name,
             performance={
-                "event_extraction_time_ms": round(event_time * 1000, 4),
-                "in_memory_graph_time_ms": round(graph_time * 1000, 4),
-                "neo4j_persistence_time_ms": None,  # Will set below
-                "total_observability_time_ms": None  # Will set below
+                "event_extraction_time_ms": event_time_ms,
+                "in_memory_graph_time_ms": graph_time_ms
             },
             noise_config=noise_config_for_storage
         )
-        t4 = time.perf_counter()
-        neo4j_time = t4 - t3a
-        total_time = t4 - t1
-        # Update the node with final timings (optional, for accuracy)
-        neo4j_store.driver.session().run(
-            """
-            MATCH (x:Execution {execution_id: $execution_id})
-            SET x.neo4j_persistence_time_ms = $neo4j_persistence_time_ms,
-                x.total_observability_time_ms = $total_observability_time_ms
-            """,
-            execution_id=execution_id,
-            neo4j_persistence_time_ms=round(neo4j_time * 1000, 4) if neo4j_time else None,
-            total_observability_time_ms=round(total_time * 1000, 4) if total_time else None
-        )
-    else:
-        t4 = time.perf_counter()
-        total_time = t4 - t1
+    t5 = time.perf_counter_ns()
+
+    # Report what was stored; if nothing was (Neo4j not configured or
+    # unavailable), fall back to the time measured here
+    if not stored_times:
+        persistence_time_ms = round((t5 - t4) / 1e6, 4)
+        stored_times = {
+            "neo4j_persistence_time_ms": persistence_time_ms,
+            # Time spent waiting on the simulation is not observability overhead
+            "total_observability_time_ms": round(event_time_ms + graph_time_ms + persistence_time_ms, 4)
+        }
 
     return {
         "execution_id": execution_id,
         "circuit_name": name,
         "num_gates": len(qc.data),
         "num_events": len(events),
-        "event_extraction_time_ms": round((t2 - t1) * 1000, 4),
-        "in_memory_graph_time_ms": round((t3 - t2) * 1000, 4),
-        "neo4j_persistence_time_ms": round((t4 - t3) * 1000, 4),
-        "total_observability_time_ms": round((t4 - t1) * 1000, 4),
+        "event_extraction_time_ms": event_time_ms,
+        "in_memory_graph_time_ms": graph_time_ms,
+        "neo4j_persistence_time_ms": stored_times["neo4j_persistence_time_ms"],
+        "total_observability_time_ms": stored_times["total_observability_time_ms"],
         "counts": counts,
-        "events": [e.__dict__ for e in events],
-        "nodes": list(graph.nodes(data=True)),
-        "edges": list(graph.edges(data=True)),
+        "events": (e.to_dict() for e in events),
+        "nodes": graph.iter_nodes(),
+        "edges": graph.iter_edges(),
         "noise_config": noise_config_dict,
         "is_noisy": noise_type is not None
     }
@@ -1,11 +1,19 @@
-import json
 import os
+from functools import lru_cache
+
+import orjson
 
 STATS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', 'stats.json')
 
+@lru_cache(maxsize=1)
+def _parse_stats(mtime_ns: int):
+    # Keyed by modification time, so the file is only parsed again after it changes
+    with open(STATS_PATH, 'rb') as f:
+        return orjson.loads(f.read())
+
 def load_stats():
+    """Load stats.json; the parsed dict is shared between calls, so treat it as read-only."""
     try:
-        with open(STATS_PATH, 'r') as f:
-            return json.load(f)
+        return _parse_stats(os.stat(STATS_PATH).st_mtime_ns)
     except Exception:
         return {}